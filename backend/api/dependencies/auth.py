@@ -1,7 +1,7 @@
 """Admin authentication dependencies.
 
 This module provides HTTP Basic Auth for admin-only endpoints.
-Credentials are read from environment variables.
+Credentials are read from application settings (ADMIN_USERNAME/ADMIN_PASSWORD).
 
 Includes rate limiting for failed auth attempts to prevent brute-force attacks.
 
@@ -12,22 +12,32 @@ Usage:
 """
 
 import logging
-import os
+import math
 import secrets
+import threading
 import time
-from collections import defaultdict
 
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 
+from core.config import get_settings
+
 logger = logging.getLogger(__name__)
 
 security = HTTPBasic()
 
-# Rate limiting for failed auth attempts (stricter than general API rate limit)
-_failed_attempts: dict[str, list[float]] = defaultdict(list)
-_ADMIN_RATE_LIMIT = 5  # Max failed attempts per window
-_ADMIN_RATE_WINDOW = 60  # Window in seconds
+# Rate limiting for failed auth attempts (stricter than general API rate limit).
+# Each client IP has a token bucket: every failed attempt consumes one token and
+# tokens refill continuously, so a full bucket allows a burst of
+# _ADMIN_RATE_LIMIT failures and then one more every
+# _ADMIN_RATE_WINDOW / _ADMIN_RATE_LIMIT seconds.
+_buckets: dict[str, tuple[float, float]] = {}  # IP -> (tokens, last update)
+_ADMIN_RATE_LIMIT = 5  # Bucket capacity (max burst of failed attempts)
+_ADMIN_RATE_WINDOW = 60  # Seconds for an empty bucket to refill completely
+_ADMIN_REFILL_RATE = _ADMIN_RATE_LIMIT / _ADMIN_RATE_WINDOW  # Tokens per second
+# verify_admin is a sync dependency run in FastAPI's threadpool, so bucket
+# reads and updates must hold this lock to avoid losing concurrent attempts
+_buckets_lock = threading.Lock()
 
 
 def _get_client_ip(request: Request) -> str:
@@ -38,6 +48,20 @@ def _get_client_ip(request: Request) -> str:
     return request.client.host if request.client else "unknown"
 
 
+def _available_tokens(client_ip: str, now: float) -> float:
+    """Get the refilled token count for a client's bucket.
+
+    Args:
+        client_ip: The client's IP address.
+        now: Current monotonic time in seconds.
+
+    Returns:
+        Tokens available, capped at the bucket capacity.
+    """
+    tokens, last_update = _buckets.get(client_ip, (_ADMIN_RATE_LIMIT, now))
+    return min(_ADMIN_RATE_LIMIT, tokens + (now - last_update) * _ADMIN_REFILL_RATE)
+
+
 def _check_rate_limit(client_ip: str) -> None:
     """Check if client has exceeded failed auth rate limit.
 
@@ -47,38 +71,35 @@ def _check_rate_limit(client_ip: str) -> None:
     Raises:
         HTTPException: 429 Too Many Requests if rate limit exceeded.
     """
-    now = time.time()
+    with _buckets_lock:
+        tokens = _available_tokens(client_ip, time.monotonic())
 
-    # Clean old attempts outside the window
-    _failed_attempts[client_ip] = [
-        t for t in _failed_attempts[client_ip] if now - t < _ADMIN_RATE_WINDOW
-    ]
-
-    if len(_failed_attempts[client_ip]) >= _ADMIN_RATE_LIMIT:
+    if tokens < 1:
+        retry_after = math.ceil((1 - tokens) / _ADMIN_REFILL_RATE)
         logger.warning(f"Admin auth rate limit exceeded for IP: {client_ip}")
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail="Too many failed authentication attempts. Please try again later.",
-            headers={"Retry-After": str(_ADMIN_RATE_WINDOW)},
+            headers={"Retry-After": str(retry_after)},
         )
 
 
 def _record_failed_attempt(client_ip: str) -> None:
-    """Record a failed authentication attempt."""
-    _failed_attempts[client_ip].append(time.time())
+    """Record a failed authentication attempt by consuming a token."""
+    with _buckets_lock:
+        now = time.monotonic()
+        _buckets[client_ip] = (_available_tokens(client_ip, now) - 1, now)
 
 
 def get_admin_credentials() -> tuple[str, str]:
-    """Get admin credentials from environment variables.
+    """Get admin credentials from application settings.
 
     Returns:
-        Tuple of (username, password) from environment.
+        Tuple of (username, password) from ADMIN_USERNAME/ADMIN_PASSWORD.
         Defaults to ("admin", "changeme") for development.
     """
-    return (
-        os.getenv("ADMIN_USERNAME", "admin"),
-        os.getenv("ADMIN_PASSWORD", "changeme"),
-    )
+    settings = get_settings()
+    return settings.admin_username, settings.admin_password
 
 
 def verify_admin(
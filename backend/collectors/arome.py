@@ -23,16 +23,19 @@ Data fields:
 """
 
 import asyncio
+import contextlib
 import logging
 import math
 import os
 import tempfile
 import time
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from decimal import ROUND_HALF_UP, Decimal
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
+import numpy as np
+import numpy.typing as npt
 import xarray as xr
 
 from collectors.base import BaseCollector
@@ -46,6 +49,34 @@ from core.data_models import ForecastData
 
 logger = logging.getLogger(__name__)
 
+# Offset between the Kelvin and Celsius scales
+KELVIN_OFFSET = 273.15
+
+# Quantization steps for forecast values
+_TENTH = Decimal("0.1")
+_UNIT = Decimal("1")
+
+# Quantization step, matching number of decimals and display unit of each
+# forecast parameter
+_PARAMETER_FORMATS: dict[str, tuple[Decimal, int, str]] = {
+    "wind_speed": (_TENTH, 1, " km/h"),
+    "wind_direction": (_UNIT, 0, "°"),
+    "temperature": (_TENTH, 1, "°C"),
+}
+
+
+def _quantize(value: float, step: Decimal) -> Decimal:
+    """Convert a float to a Decimal rounded half-up to the given step.
+
+    Args:
+        value: Value to convert.
+        step: Quantization step (e.g., Decimal("0.1")).
+
+    Returns:
+        Rounded Decimal value.
+    """
+    return Decimal(str(value)).quantize(step, rounding=ROUND_HALF_UP)
+
 
 class AROMECollector(BaseCollector):
     """Collector for AROME GRIB2 data from Météo-France.
@@ -105,6 +136,14 @@ class AROMECollector(BaseCollector):
         "temperature": "t2m",  # 2m temperature
     }
 
+    # cfgrib filters for each dataset: cfgrib cannot combine variables at
+    # different heights (u10/v10 at 10m, t2m at 2m). The 2m level also holds
+    # humidity, which is skipped; cfgrib does not accept lists of shortNames.
+    GRIB2_FILTERS: dict[str, dict[str, Any]] = {
+        "wind": {"typeOfLevel": "heightAboveGround", "level": 10},
+        "temp": {"typeOfLevel": "heightAboveGround", "level": 2, "shortName": "2t"},
+    }
+
     def __init__(self, api_token: str | None = None):
         """Initialize AROME collector.
 
@@ -113,19 +152,37 @@ class AROMECollector(BaseCollector):
                        If not provided, uses METEOFRANCE_API_TOKEN env var.
         """
         self._api_token = api_token or os.getenv("METEOFRANCE_API_TOKEN", "")
+        self._headers: dict[str, str] = {
+            "User-Agent": "MeteoScore/1.0 (Weather Forecast Accuracy Platform)",
+            "Accept": "*/*",
+        }
+        if self._api_token:
+            # Météo-France API uses 'apikey' header, not Bearer token
+            self._headers["apikey"] = self._api_token
         self._last_request_time: float = 0.0
+        self._next_request_time: float = 0.0
+        # Float copy of VALIDATION_RANGES: values are validated as floats
+        # before any Decimal is built
+        self._validation_bounds: dict[str, tuple[float, float]] = {
+            parameter: (float(min_val), float(max_val))
+            for parameter, (min_val, max_val) in self.VALIDATION_RANGES.items()
+        }
 
     async def _enforce_rate_limit(self) -> None:
         """Enforce rate limiting between API requests.
 
         Ensures minimum interval between requests to respect
         Météo-France API rate limit of 50 requests per minute.
+
+        Each call reserves the next request slot before sleeping, so
+        concurrent callers are spaced out without needing a lock.
         """
         current_time = time.monotonic()
-        elapsed = current_time - self._last_request_time
+        request_time = max(current_time, self._next_request_time)
+        self._next_request_time = request_time + self.MIN_REQUEST_INTERVAL
 
-        if elapsed < self.MIN_REQUEST_INTERVAL:
-            wait_time = self.MIN_REQUEST_INTERVAL - elapsed
+        wait_time = request_time - current_time
+        if wait_time > 0:
             logger.debug(f"Rate limiting: waiting {wait_time:.2f}s before next request")
             await asyncio.sleep(wait_time)
 
@@ -163,9 +220,48 @@ class AROMECollector(BaseCollector):
             )
             return []
 
+        forecasts = await self.collect_forecast_batch(
+            sites={site_id: (latitude, longitude)},
+            forecast_run=forecast_run,
+            model_id=model_id,
+            parameter_ids=parameter_ids,
+        )
+        return forecasts[site_id]
+
+    async def collect_forecast_batch(
+        self,
+        sites: dict[int, tuple[float, float]],
+        forecast_run: datetime,
+        model_id: int = 3,  # AROME model ID
+        parameter_ids: dict[str, int] | None = None,
+    ) -> dict[int, list[ForecastData]]:
+        """Collect forecast data for several sites from a single AROME download.
+
+        The AROME package covers the whole grid, so it is downloaded and
+        parsed once, then interpolated to each site.
+
+        Args:
+            sites: Mapping of site IDs to (latitude, longitude).
+            forecast_run: Datetime of the forecast model run (UTC).
+            model_id: Database ID for AROME model (default: 3).
+            parameter_ids: Mapping of parameter names to IDs.
+
+        Returns:
+            Mapping of site IDs to ForecastData lists. Sites that could not
+            be processed map to an empty list.
+
+        Raises:
+            No exceptions are raised - errors return empty lists.
+        """
+        results: dict[int, list[ForecastData]] = {site_id: [] for site_id in sites}
+        if not sites:
+            return results
+
         if parameter_ids is None:
             parameter_ids = self.DEFAULT_PARAMETER_IDS
 
+        site_label = f"site {next(iter(sites))}" if len(sites) == 1 else f"{len(sites)} sites"
+
         try:
             # Download GRIB2 data
             grib2_bytes = await self._download_grib2(
@@ -174,41 +270,44 @@ class AROMECollector(BaseCollector):
             )
 
             if not grib2_bytes:
-                logger.warning(f"Empty GRIB2 data received for site {site_id}")
-                return []
+                logger.warning(f"Empty GRIB2 data received for {site_label}")
+                return results
 
             # Parse GRIB2 to xarray datasets (wind and temp separately)
             datasets = self._parse_grib2_bytes(grib2_bytes)
             if datasets is None:
-                logger.warning(f"Failed to parse GRIB2 data for site {site_id}")
-                return []
+                logger.warning(f"Failed to parse GRIB2 data for {site_label}")
+                return results
 
-            try:
-                # Extract forecast data from both datasets
-                return self._parse_grib2_data(
-                    datasets=datasets,
-                    site_id=site_id,
-                    model_id=model_id,
-                    latitude=latitude,
-                    longitude=longitude,
-                    forecast_run=forecast_run,
-                    parameter_ids=parameter_ids,
-                )
-            finally:
-                # Close xarray datasets to release resources
+            with contextlib.ExitStack() as stack:
+                # Close xarray datasets to release resources, even on error
                 for ds in datasets.values():
-                    ds.close()
+                    stack.enter_context(contextlib.closing(ds))
+
+                # Extract forecast data from both datasets for each site
+                for site_id, (latitude, longitude) in sites.items():
+                    results[site_id] = self._parse_grib2_data(
+                        datasets=datasets,
+                        site_id=site_id,
+                        model_id=model_id,
+                        latitude=latitude,
+                        longitude=longitude,
+                        forecast_run=forecast_run,
+                        parameter_ids=parameter_ids,
+                    )
+
+            return results
 
         except (HttpClientError, RetryExhaustedError) as e:
             logger.warning(
-                f"HTTP error fetching AROME data for site {site_id}: {e}"
+                f"HTTP error fetching AROME data for {site_label}: {e}"
             )
-            return []
+            return results
         except Exception as e:
             logger.error(
-                f"Unexpected error fetching AROME data for site {site_id}: {e}"
+                f"Unexpected error fetching AROME data for {site_label}: {e}"
             )
-            return []
+            return results
 
     async def collect_observation(
         self,
@@ -320,19 +419,13 @@ class AROMECollector(BaseCollector):
     def _get_headers(self) -> dict[str, str]:
         """Get required HTTP headers for API request.
 
+        Headers only depend on the API token, so they are built once in
+        __init__ and shared by all requests. Callers must not modify them.
+
         Returns:
             Dictionary of HTTP headers.
         """
-        headers = {
-            "User-Agent": "MeteoScore/1.0 (Weather Forecast Accuracy Platform)",
-            "Accept": "*/*",
-        }
-
-        if self._api_token:
-            # Météo-France API uses 'apikey' header, not Bearer token
-            headers["apikey"] = self._api_token
-
-        return headers
+        return self._headers
 
     def _parse_grib2_bytes(self, grib2_bytes: bytes) -> dict[str, xr.Dataset] | None:
         """Parse GRIB2 bytes into xarray Datasets.
@@ -358,43 +451,23 @@ class AROMECollector(BaseCollector):
                 f.write(grib2_bytes)
                 temp_path = f.name
 
-            # Open wind components (10m height)
-            try:
-                ds_wind = xr.open_dataset(
-                    temp_path,
-                    engine="cfgrib",
-                    backend_kwargs={
-                        "filter_by_keys": {
-                            "typeOfLevel": "heightAboveGround",
-                            "level": 10,
-                        },
-                        "errors": "ignore",
-                    },
-                )
-                # Load into memory so file can be deleted
-                datasets["wind"] = ds_wind.load()
-                ds_wind.close()
-            except Exception as e:
-                logger.warning(f"Failed to parse wind data from GRIB2: {e}")
-
-            # Open temperature (2m height)
-            try:
-                ds_temp = xr.open_dataset(
-                    temp_path,
-                    engine="cfgrib",
-                    backend_kwargs={
-                        "filter_by_keys": {
-                            "typeOfLevel": "heightAboveGround",
-                            "level": 2,
+            for key, filter_by_keys in self.GRIB2_FILTERS.items():
+                try:
+                    ds = xr.open_dataset(
+                        temp_path,
+                        engine="cfgrib",
+                        backend_kwargs={
+                            "filter_by_keys": filter_by_keys,
+                            # Single-use file: don't write a .idx sidecar
+                            "indexpath": "",
+                            "errors": "ignore",
                         },
-                        "errors": "ignore",
-                    },
-                )
-                # Load into memory so file can be deleted
-                datasets["temp"] = ds_temp.load()
-                ds_temp.close()
-            except Exception as e:
-                logger.warning(f"Failed to parse temperature data from GRIB2: {e}")
+                    )
+                    # Load into memory so file can be deleted
+                    datasets[key] = ds.load()
+                    ds.close()
+                except Exception as e:
+                    logger.warning(f"Failed to parse {key} data from GRIB2: {e}")
 
             if not datasets:
                 logger.warning("No datasets could be parsed from GRIB2")
@@ -481,39 +554,47 @@ class AROMECollector(BaseCollector):
         forecast_run: datetime,
         parameter_ids: dict[str, int],
     ) -> list[ForecastData]:
-        """Process wind dataset to extract forecast data."""
-        results: list[ForecastData] = []
+        """Process wind dataset to extract forecast data.
 
-        time_coord = self._get_time_coordinate(site_data)
-        if time_coord is None:
+        Speed and direction are computed for the whole time series with numpy.
+        """
+        series = self._get_site_series(
+            site_data, [self.GRIB2_VARS["u_wind"], self.GRIB2_VARS["v_wind"]]
+        )
+        if series is None:
             return []
 
-        for time_val in time_coord.values:
-            try:
-                valid_time = self._numpy_to_datetime(time_val)
-                if valid_time is None:
-                    continue
-
-                # Use the valid run time for horizon calculation
-                valid_run = self._get_latest_run_time(forecast_run)
-                horizon = int((valid_time - valid_run).total_seconds() / 3600)
+        time_values, (u, v) = series
+        speeds = np.sqrt(u * u + v * v) * 3.6
+        directions = np.degrees(np.arctan2(-u, -v))
+        # Normalize to 0-360 range in place without branching;
+        # calm wind has no direction, report 0
+        np.add(directions, 360.0 * (directions < 0), out=directions)
+        directions[(u == 0) & (v == 0)] = 0.0
 
-                wind_results = self._extract_wind_data(
-                    data=site_data,
-                    time_val=time_val,
-                    site_id=site_id,
-                    model_id=model_id,
-                    parameter_ids=parameter_ids,
-                    forecast_run=valid_run,
-                    valid_time=valid_time,
-                    horizon=horizon,
-                )
-                results.extend(wind_results)
-            except Exception as e:
-                logger.warning(f"Error processing wind time step {time_val}: {e}")
-                continue
-
-        return results
+        valid_run = self._get_latest_run_time(forecast_run)
+        valid_times = self._get_valid_times(time_values, valid_run)
+        horizons = self._get_horizons(time_values, valid_run)
+
+        return self._build_forecasts(
+            parameter="wind_speed",
+            values=speeds,
+            valid_times=valid_times,
+            horizons=horizons,
+            site_id=site_id,
+            model_id=model_id,
+            parameter_id=parameter_ids.get("wind_speed", 1),
+            forecast_run=valid_run,
+        ) + self._build_forecasts(
+            parameter="wind_direction",
+            values=directions,
+            valid_times=valid_times,
+            horizons=horizons,
+            site_id=site_id,
+            model_id=model_id,
+            parameter_id=parameter_ids.get("wind_direction", 2),
+            forecast_run=valid_run,
+        )
 
     def _process_temp_dataset(
         self,
@@ -523,40 +604,117 @@ class AROMECollector(BaseCollector):
         forecast_run: datetime,
         parameter_ids: dict[str, int],
     ) -> list[ForecastData]:
-        """Process temperature dataset to extract forecast data."""
-        results: list[ForecastData] = []
+        """Process temperature dataset to extract forecast data.
 
-        time_coord = self._get_time_coordinate(site_data)
-        if time_coord is None:
+        Converts the whole time series from Kelvin to Celsius in one numpy
+        operation.
+        """
+        series = self._get_site_series(site_data, [self.GRIB2_VARS["temperature"]])
+        if series is None:
             return []
 
-        for time_val in time_coord.values:
-            try:
-                valid_time = self._numpy_to_datetime(time_val)
-                if valid_time is None:
-                    continue
+        time_values, (t_kelvin,) = series
+        valid_run = self._get_latest_run_time(forecast_run)
+
+        return self._build_forecasts(
+            parameter="temperature",
+            values=t_kelvin - KELVIN_OFFSET,
+            valid_times=self._get_valid_times(time_values, valid_run),
+            horizons=self._get_horizons(time_values, valid_run),
+            site_id=site_id,
+            model_id=model_id,
+            parameter_id=parameter_ids.get("temperature", 3),
+            forecast_run=valid_run,
+        )
+
+    def _build_forecasts(
+        self,
+        parameter: str,
+        values: npt.NDArray[np.float64],
+        valid_times: list[datetime | None],
+        horizons: npt.NDArray[np.int64],
+        site_id: int,
+        model_id: int,
+        parameter_id: int,
+        forecast_run: datetime,
+    ) -> list[ForecastData]:
+        """Build ForecastData records for the valid values of a parameter.
+
+        Values are rounded and validated with a single numpy mask; Decimals
+        are only built for the values that pass validation.
+
+        Args:
+            parameter: Parameter name (wind_speed, wind_direction, temperature).
+            values: Float values aligned with valid_times.
+            valid_times: Valid time of each value (None if unparseable).
+            horizons: Forecast horizon in hours of each value.
+            site_id: Database ID of the site.
+            model_id: Database ID of the model.
+            parameter_id: Database ID of the parameter.
+            forecast_run: Valid AROME run time.
+
+        Returns:
+            List of ForecastData for the valid values.
+        """
+        step, decimals, unit = _PARAMETER_FORMATS[parameter]
+        rounded = np.round(values, decimals)
+        usable = np.isfinite(values) & np.array([t is not None for t in valid_times], dtype=bool)
+        valid = self._valid_mask(parameter, rounded)
 
-                valid_run = self._get_latest_run_time(forecast_run)
-                horizon = int((valid_time - valid_run).total_seconds() / 3600)
+        for index in np.flatnonzero(usable & ~valid):
+            logger.warning(
+                f"Aberrant {parameter.replace('_', ' ')} {rounded[index]}{unit} "
+                f"at {valid_times[index]}, skipping"
+            )
 
-                temp_result = self._extract_temperature(
-                    data=site_data,
-                    time_val=time_val,
+        results: list[ForecastData] = []
+        for index in np.flatnonzero(usable & valid):
+            results.append(
+                ForecastData(
                     site_id=site_id,
                     model_id=model_id,
-                    parameter_ids=parameter_ids,
-                    forecast_run=valid_run,
-                    valid_time=valid_time,
-                    horizon=horizon,
+                    parameter_id=parameter_id,
+                    forecast_run=forecast_run,
+                    valid_time=valid_times[index],
+                    horizon=int(horizons[index]),
+                    value=_quantize(float(values[index]), step),
                 )
-                if temp_result:
-                    results.append(temp_result)
-            except Exception as e:
-                logger.warning(f"Error processing temp time step {time_val}: {e}")
-                continue
+            )
 
         return results
 
+    def _get_site_series(
+        self,
+        site_data: xr.Dataset,
+        variables: list[str],
+    ) -> tuple[npt.NDArray[Any], list[npt.NDArray[np.float64]]] | None:
+        """Extract time values and variable time series from site data.
+
+        Args:
+            site_data: Dataset interpolated to the site location.
+            variables: Names of the data variables to extract.
+
+        Returns:
+            Tuple of (time values, float64 arrays aligned with the time values),
+            or None if a variable or the time coordinate is missing.
+        """
+        if any(var not in site_data.data_vars for var in variables):
+            return None
+
+        time_coord = self._get_time_coordinate(site_data)
+        if time_coord is None:
+            return None
+
+        time_values = np.ravel(time_coord.values)
+        arrays = [
+            np.ravel(np.asarray(site_data[var].values, dtype=np.float64)) for var in variables
+        ]
+        if any(arr.size != time_values.size for arr in arrays):
+            logger.warning(f"Values of {variables} do not match the time coordinate, skipping")
+            return None
+
+        return time_values, arrays
+
     def _interpolate_to_site(
         self,
         dataset: xr.Dataset,
@@ -592,16 +750,130 @@ class AROMECollector(BaseCollector):
                 logger.warning("Could not find lat/lon coordinates in dataset")
                 return None
 
-            # Interpolate to site location
-            return dataset.interp(
-                {lat_name: latitude, lon_name: longitude},
-                method="linear",
+            # Locate the grid cell around the site on the regular lat/lon grid
+            lat_cell = self._find_grid_cell(dataset[lat_name].values, latitude)
+            lon_cell = self._find_grid_cell(dataset[lon_name].values, longitude)
+            if lat_cell is None or lon_cell is None:
+                logger.warning(
+                    f"Site ({latitude}, {longitude}) is outside the AROME grid"
+                )
+                return None
+
+            i, wy = lat_cell
+            j, wx = lon_cell
+            weights = np.array(
+                [[(1 - wy) * (1 - wx), (1 - wy) * wx], [wy * (1 - wx), wy * wx]]
+            )
+
+            # Bilinear weighted sum of the 4 neighbouring grid points
+            site_vars = {}
+            for name, var in dataset.data_vars.items():
+                if lat_name not in var.dims or lon_name not in var.dims:
+                    site_vars[name] = var
+                    continue
+
+                lat_axis = var.dims.index(lat_name)
+                lon_axis = var.dims.index(lon_name)
+                values = np.moveaxis(var.values, (lat_axis, lon_axis), (-2, -1))[
+                    ..., i : i + 2, j : j + 2
+                ]
+                dims = [dim for dim in var.dims if dim not in (lat_name, lon_name)]
+                site_vars[name] = xr.DataArray(
+                    (values * weights).sum(axis=(-2, -1)),
+                    dims=dims,
+                    coords={
+                        coord_name: coord
+                        for coord_name, coord in var.coords.items()
+                        if lat_name not in coord.dims and lon_name not in coord.dims
+                        and coord_name not in (lat_name, lon_name)
+                    },
+                )
+
+            return xr.Dataset(site_vars).assign_coords(
+                {lat_name: latitude, lon_name: longitude}
             )
 
         except Exception as e:
             logger.warning(f"Interpolation failed: {e}")
             return None
 
+    @staticmethod
+    def _find_grid_cell(
+        coords: npt.NDArray[np.float64], value: float
+    ) -> tuple[int, float] | None:
+        """Find the grid cell containing a value along a 1-D coordinate.
+
+        Works for both ascending and descending coordinates (GRIB2 grids
+        usually store latitudes from north to south).
+
+        Args:
+            coords: 1-D array of grid coordinates.
+            value: Coordinate to locate.
+
+        Returns:
+            Tuple of (index of the first cell point, weight of the second
+            cell point), or None if the value is outside the grid.
+        """
+        size = coords.size
+        if coords.ndim != 1 or size < 2:
+            return None
+
+        descending = coords[0] > coords[-1]
+        ordered = coords[::-1] if descending else coords
+        if not ordered[0] <= value <= ordered[-1]:
+            return None
+
+        index = min(int(np.searchsorted(ordered, value, side="right")) - 1, size - 2)
+        weight = float((value - ordered[index]) / (ordered[index + 1] - ordered[index]))
+
+        if descending:
+            return size - 2 - index, 1.0 - weight
+        return index, weight
+
+    def _get_horizons(
+        self, time_values: npt.NDArray[Any], forecast_run: datetime
+    ) -> npt.NDArray[np.int64]:
+        """Compute forecast horizons for a series of valid times.
+
+        Args:
+            time_values: numpy datetime64 valid times (UTC), or timedelta64
+                steps from forecast_run when the time axis is "step".
+            forecast_run: Valid AROME run time.
+
+        Returns:
+            Array of whole hours from forecast_run to each valid time.
+        """
+        if np.issubdtype(time_values.dtype, np.timedelta64):
+            # Steps are already offsets from the run
+            hours = time_values.astype("timedelta64[ns]") / np.timedelta64(1, "h")
+        else:
+            run = np.datetime64(
+                forecast_run.astimezone(timezone.utc).replace(tzinfo=None), "ns"
+            )
+            hours = (time_values.astype("datetime64[ns]") - run) / np.timedelta64(1, "h")
+        # Truncate toward zero; NaT entries are dropped by the caller
+        return np.trunc(np.nan_to_num(hours)).astype(np.int64)
+
+    def _get_valid_times(
+        self, time_values: npt.NDArray[Any], forecast_run: datetime
+    ) -> list[datetime | None]:
+        """Convert a series of time values to Python valid times.
+
+        Args:
+            time_values: numpy datetime64 valid times (UTC), or timedelta64
+                steps from forecast_run when the time axis is "step".
+            forecast_run: Valid AROME run time.
+
+        Returns:
+            List of UTC valid times (None for unparseable values).
+        """
+        if np.issubdtype(time_values.dtype, np.timedelta64):
+            run = np.datetime64(
+                forecast_run.astimezone(timezone.utc).replace(tzinfo=None), "ns"
+            )
+            time_values = run + time_values.astype("timedelta64[ns]")
+        return [self._numpy_to_datetime(time_val) for time_val in time_values]
+
     def _get_time_coordinate(self, dataset: xr.Dataset) -> xr.DataArray | None:
         """Get time coordinate from dataset.
 
@@ -626,8 +898,6 @@ class AROMECollector(BaseCollector):
             Python datetime with UTC timezone or None.
         """
         try:
-            import numpy as np
-
             # Handle different numpy datetime types
             if isinstance(np_time, np.datetime64):
                 # Convert to timestamp and then to datetime
@@ -643,177 +913,12 @@ class AROMECollector(BaseCollector):
                 # Try to convert using pandas
                 import pandas as pd
 
-                return pd.Timestamp(np_time).to_pydatetime().replace(tzinfo=timezone.utc)
+                timestamp = pd.Timestamp(np_time).to_pydatetime()
+                return cast(datetime, timestamp).replace(tzinfo=timezone.utc)
         except Exception as e:
             logger.warning(f"Failed to convert time value {np_time}: {e}")
             return None
 
-    def _extract_wind_data(
-        self,
-        data: xr.Dataset,
-        time_val: Any,
-        site_id: int,
-        model_id: int,
-        parameter_ids: dict[str, int],
-        forecast_run: datetime,
-        valid_time: datetime,
-        horizon: int,
-    ) -> list[ForecastData]:
-        """Extract wind speed and direction from data.
-
-        Args:
-            data: Interpolated xarray Dataset.
-            time_val: Time value to extract.
-            site_id: Database ID of the site.
-            model_id: Database ID of the model.
-            parameter_ids: Mapping of parameter names to IDs.
-            forecast_run: Forecast model run datetime.
-            valid_time: Valid time for this data.
-            horizon: Forecast horizon in hours.
-
-        Returns:
-            List of ForecastData for wind speed and direction.
-        """
-        results: list[ForecastData] = []
-
-        u_var = self.GRIB2_VARS["u_wind"]
-        v_var = self.GRIB2_VARS["v_wind"]
-
-        # Check if wind variables exist
-        if u_var not in data.data_vars or v_var not in data.data_vars:
-            return []
-
-        try:
-            # Get time coordinate name
-            time_name = None
-            for name in ["valid_time", "time"]:
-                if name in data.coords:
-                    time_name = name
-                    break
-
-            if time_name is None:
-                return []
-
-            # Extract U/V values at this time
-            u_data = data[u_var].sel({time_name: time_val})
-            v_data = data[v_var].sel({time_name: time_val})
-
-            # Get scalar values (already interpolated to site)
-            u = float(u_data.values.flatten()[0])
-            v = float(v_data.values.flatten()[0])
-
-            # Calculate wind speed
-            wind_speed = self._calculate_wind_speed(u, v)
-            if self._is_valid_value("wind_speed", wind_speed):
-                results.append(
-                    ForecastData(
-                        site_id=site_id,
-                        model_id=model_id,
-                        parameter_id=parameter_ids.get("wind_speed", 1),
-                        forecast_run=forecast_run,
-                        valid_time=valid_time,
-                        horizon=horizon,
-                        value=wind_speed,
-                    )
-                )
-            else:
-                logger.warning(
-                    f"Aberrant wind speed {wind_speed} km/h at {valid_time}, skipping"
-                )
-
-            # Calculate wind direction
-            wind_direction = self._calculate_wind_direction(u, v)
-            if self._is_valid_value("wind_direction", wind_direction):
-                results.append(
-                    ForecastData(
-                        site_id=site_id,
-                        model_id=model_id,
-                        parameter_id=parameter_ids.get("wind_direction", 2),
-                        forecast_run=forecast_run,
-                        valid_time=valid_time,
-                        horizon=horizon,
-                        value=wind_direction,
-                    )
-                )
-            else:
-                logger.warning(
-                    f"Aberrant wind direction {wind_direction}° at {valid_time}, skipping"
-                )
-
-        except Exception as e:
-            logger.warning(f"Error extracting wind data: {e}")
-
-        return results
-
-    def _extract_temperature(
-        self,
-        data: xr.Dataset,
-        time_val: Any,
-        site_id: int,
-        model_id: int,
-        parameter_ids: dict[str, int],
-        forecast_run: datetime,
-        valid_time: datetime,
-        horizon: int,
-    ) -> ForecastData | None:
-        """Extract temperature from data.
-
-        Args:
-            data: Interpolated xarray Dataset.
-            time_val: Time value to extract.
-            site_id: Database ID of the site.
-            model_id: Database ID of the model.
-            parameter_ids: Mapping of parameter names to IDs.
-            forecast_run: Forecast model run datetime.
-            valid_time: Valid time for this data.
-            horizon: Forecast horizon in hours.
-
-        Returns:
-            ForecastData for temperature or None.
-        """
-        t_var = self.GRIB2_VARS["temperature"]
-
-        if t_var not in data.data_vars:
-            return None
-
-        try:
-            # Get time coordinate name
-            time_name = None
-            for name in ["valid_time", "time"]:
-                if name in data.coords:
-                    time_name = name
-                    break
-
-            if time_name is None:
-                return None
-
-            # Extract temperature at this time
-            t_data = data[t_var].sel({time_name: time_val})
-            t_kelvin = float(t_data.values.flatten()[0])
-
-            # Convert to Celsius
-            temperature = self._kelvin_to_celsius(t_kelvin)
-
-            if self._is_valid_value("temperature", temperature):
-                return ForecastData(
-                    site_id=site_id,
-                    model_id=model_id,
-                    parameter_id=parameter_ids.get("temperature", 3),
-                    forecast_run=forecast_run,
-                    valid_time=valid_time,
-                    horizon=horizon,
-                    value=temperature,
-                )
-            else:
-                logger.warning(
-                    f"Aberrant temperature {temperature}°C at {valid_time}, skipping"
-                )
-                return None
-
-        except Exception as e:
-            logger.warning(f"Error extracting temperature: {e}")
-            return None
-
     def _calculate_wind_speed(self, u: float, v: float) -> Decimal:
         """Calculate wind speed from U/V components.
 
@@ -850,9 +955,8 @@ class AROMECollector(BaseCollector):
         direction_rad = math.atan2(-u, -v)
         direction_deg = math.degrees(direction_rad)
 
-        # Normalize to 0-360 range
-        if direction_deg < 0:
-            direction_deg += 360
+        # Normalize to 0-360 range (branchless: adds 360 only when negative)
+        direction_deg += 360.0 * (direction_deg < 0)
 
         return Decimal(str(direction_deg)).quantize(
             Decimal("1"), rounding=ROUND_HALF_UP
@@ -867,12 +971,29 @@ class AROMECollector(BaseCollector):
         Returns:
             Temperature in Celsius as Decimal.
         """
-        celsius = kelvin - 273.15
-        return Decimal(str(celsius)).quantize(
-            Decimal("0.1"), rounding=ROUND_HALF_UP
-        )
+        return _quantize(kelvin - KELVIN_OFFSET, _TENTH)
+
+    def _valid_mask(
+        self, parameter: str, values: npt.NDArray[np.float64]
+    ) -> npt.NDArray[np.bool_]:
+        """Check an array of values against the valid range for parameter.
+
+        Args:
+            parameter: Parameter name (wind_speed, wind_direction, temperature).
+            values: Values to validate.
+
+        Returns:
+            Boolean mask, True where the value is within the valid range.
+            NaN values are never valid.
+        """
+        bounds = self._validation_bounds.get(parameter)
+        if bounds is None:
+            return ~np.isnan(values)
+
+        min_val, max_val = bounds
+        return (values >= min_val) & (values <= max_val)
 
-    def _is_valid_value(self, parameter: str, value: Decimal) -> bool:
+    def _is_valid_value(self, parameter: str, value: Decimal | float) -> bool:
         """Check if value is within valid range for parameter.
 
         Args:
@@ -882,8 +1003,9 @@ class AROMECollector(BaseCollector):
         Returns:
             True if value is within valid range, False otherwise.
         """
-        if parameter not in self.VALIDATION_RANGES:
+        bounds = self._validation_bounds.get(parameter)
+        if bounds is None:
             return True
 
-        min_val, max_val = self.VALIDATION_RANGES[parameter]
-        return min_val <= value <= max_val
+        min_val, max_val = bounds
+        return min_val <= float(value) <= max_val
@@ -9,6 +9,8 @@ Environment Variables:
     API_BASE_URL: API base URL
     ENVIRONMENT: Runtime environment (development/production)
     RATE_LIMIT_PER_MINUTE: API rate limit per IP
+    ADMIN_USERNAME: Admin dashboard Basic Auth username
+    ADMIN_PASSWORD: Admin dashboard Basic Auth password
 """
 
 from functools import lru_cache
@@ -30,6 +32,8 @@ class Settings(BaseSettings):
         api_base_url: API server base URL.
         environment: Runtime environment (development or production).
         rate_limit_per_minute: Maximum requests per minute per IP.
+        admin_username: Username for admin dashboard Basic Auth.
+        admin_password: Password for admin dashboard Basic Auth.
     """
 
     # Database configuration
@@ -45,6 +49,10 @@ class Settings(BaseSettings):
     # Rate limiting
     rate_limit_per_minute: int = 100
 
+    # Admin dashboard credentials
+    admin_username: str = "admin"
+    admin_password: str = "changeme"
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
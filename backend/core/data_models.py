@@ -14,7 +14,7 @@ from datetime import datetime
 from decimal import Decimal
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ForecastData:
     """Data transfer object for forecast values.
 
@@ -51,7 +51,7 @@ class ForecastData:
     value: Decimal
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ObservationData:
     """Data transfer object for observation values.
 
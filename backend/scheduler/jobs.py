@@ -202,18 +202,25 @@ async def collect_all_forecasts() -> dict[str, Any]:
         errors.append(error_msg)
         status = "partial"
 
-    # Collect from AROME
+    # Collect from AROME (one GRIB2 download covers every site)
     try:
         arome_collector = AROMECollector()
+        arome_sites: dict[int, tuple[float, float]] = {}
         for site in sites:
-            try:
-                forecast_run = datetime.now(timezone.utc)
-                data = await arome_collector.collect_forecast(
-                    site_id=site["site_id"],
-                    forecast_run=forecast_run,
-                    latitude=site["latitude"],
-                    longitude=site["longitude"],
+            if site["latitude"] is None or site["longitude"] is None:
+                logger.warning(
+                    f"Missing coordinates for site {site['site_id']}. "
+                    "Cannot fetch from AROME API."
                 )
+                continue
+            arome_sites[site["site_id"]] = (site["latitude"], site["longitude"])
+        arome_forecasts = await arome_collector.collect_forecast_batch(
+            sites=arome_sites,
+            forecast_run=datetime.now(timezone.utc),
+        )
+        for site in sites:
+            try:
+                data = arome_forecasts.get(site["site_id"], [])
                 if data:
                     # Save immediately after collection
                     _, persisted = await save_forecasts(data, "AROME")
@@ -20,6 +20,9 @@ from core.models import ExecutionLog, Forecast, Model, Observation
 
 logger = logging.getLogger(__name__)
 
+# Rows per multi-row INSERT (6 bind parameters per row, asyncpg allows 32767)
+FORECAST_INSERT_BATCH_SIZE = 1000
+
 
 async def get_model_id_by_name(db: AsyncSession, name: str) -> int | None:
     """Look up model ID by name.
@@ -42,7 +45,7 @@ async def save_forecasts(
 ) -> tuple[int, int]:
     """Save forecast data to database.
 
-    Uses INSERT ... ON CONFLICT DO NOTHING for idempotency.
+    Uses batched multi-row INSERT ... ON CONFLICT DO NOTHING for idempotency.
 
     Args:
         forecasts: List of ForecastData to save.
@@ -59,22 +62,25 @@ async def save_forecasts(
 
     async with async_session() as db:
         try:
-            for f in forecasts:
-                # Build insert statement with ON CONFLICT DO NOTHING
-                stmt = pg_insert(Forecast).values(
-                    site_id=f.site_id,
-                    model_id=f.model_id,
-                    parameter_id=f.parameter_id,
-                    forecast_run=f.forecast_run,
-                    valid_time=f.valid_time,
-                    value=f.value,
-                ).on_conflict_do_nothing(
+            # One multi-row INSERT per chunk instead of one round trip per row
+            for start in range(0, len(forecasts), FORECAST_INSERT_BATCH_SIZE):
+                batch = forecasts[start : start + FORECAST_INSERT_BATCH_SIZE]
+                stmt = pg_insert(Forecast).values([
+                    {
+                        "site_id": f.site_id,
+                        "model_id": f.model_id,
+                        "parameter_id": f.parameter_id,
+                        "forecast_run": f.forecast_run,
+                        "valid_time": f.valid_time,
+                        "value": f.value,
+                    }
+                    for f in batch
+                ]).on_conflict_do_nothing(
                     constraint="uq_forecasts_unique"
                 )
 
                 result = await db.execute(stmt)
-                if result.rowcount > 0:
-                    inserted += 1
+                inserted += max(result.rowcount, 0)
 
             await db.commit()
             logger.info(
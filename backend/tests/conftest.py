@@ -262,3 +262,8 @@ async def test_client(test_app) -> AsyncGenerator[AsyncClient, None]:
 
     # Clean up rate limiter state after test
     request_counts.clear()
+
+    # Routes that open their own sessions (e.g. execution history) use the
+    # global engine, whose pooled connections are bound to this test's loop
+    from core.database import close_engine
+    await close_engine()
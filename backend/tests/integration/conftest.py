@@ -0,0 +1,40 @@
+"""Pytest configuration for integration tests.
+
+Integration tests are dominated by network I/O over asyncio, so they run
+on uvloop instead of the default selector event loop.
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+import uvloop
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Use uvloop's event loop policy for all integration tests."""
+    return uvloop.EventLoopPolicy()
+
+
+@pytest_asyncio.fixture
+async def parameters(test_db: AsyncSession) -> dict[str, int]:
+    """Create the weather parameters used by the collectors.
+
+    Scope: function (test_db tables are recreated for each test).
+
+    Returns:
+        Mapping of parameter name to database ID.
+    """
+    from core.models import Parameter
+
+    params = [
+        Parameter(name="wind_speed", unit="km/h"),
+        Parameter(name="wind_direction", unit="degrees"),
+        Parameter(name="temperature", unit="C"),
+    ]
+    test_db.add_all(params)
+    await test_db.commit()
+
+    return {param.name: param.id for param in params}
@@ -20,10 +20,10 @@ class TestForecastCollectionPipeline:
     """E2E tests for forecast data collection and persistence."""
 
     @pytest.mark.asyncio
-    async def test_meteo_parapente_collection_and_persistence(self, test_db):
+    async def test_meteo_parapente_collection_and_persistence(self, test_db, parameters):
         """Test full collection -> persistence -> retrieval flow."""
         from collectors import MeteoParapenteCollector
-        from core.models import Forecast, Model, Parameter, Site
+        from core.models import Forecast, Model, Site
         from services.storage_service import save_forecasts
 
         # Setup: Create required database records
@@ -34,11 +34,8 @@ class TestForecastCollectionPipeline:
             altitude=1360,
         )
         model = Model(name="Meteo-Parapente", source="Meteo-Parapente API")
-        param_wind_speed = Parameter(name="wind_speed", unit="km/h")
-        param_wind_dir = Parameter(name="wind_direction", unit="degrees")
-        param_temp = Parameter(name="temperature", unit="C")
 
-        test_db.add_all([site, model, param_wind_speed, param_wind_dir, param_temp])
+        test_db.add_all([site, model])
         await test_db.commit()
         await test_db.refresh(site)
 
@@ -68,10 +65,10 @@ class TestForecastCollectionPipeline:
         assert db_count == total_persisted, "DB count should match persisted count"
 
     @pytest.mark.asyncio
-    async def test_collection_deduplication(self, test_db):
+    async def test_collection_deduplication(self, test_db, parameters):
         """Test that duplicate forecasts are not inserted twice."""
         from collectors import MeteoParapenteCollector
-        from core.models import Forecast, Model, Parameter, Site
+        from core.models import Forecast, Model, Site
         from services.storage_service import save_forecasts
 
         # Setup: Create required database records
@@ -82,11 +79,8 @@ class TestForecastCollectionPipeline:
             altitude=1360,
         )
         model = Model(name="Meteo-Parapente", source="Meteo-Parapente API")
-        param_wind_speed = Parameter(name="wind_speed", unit="km/h")
-        param_wind_dir = Parameter(name="wind_direction", unit="degrees")
-        param_temp = Parameter(name="temperature", unit="C")
 
-        test_db.add_all([site, model, param_wind_speed, param_wind_dir, param_temp])
+        test_db.add_all([site, model])
         await test_db.commit()
         await test_db.refresh(site)
 
@@ -125,10 +119,10 @@ class TestObservationCollectionPipeline:
         return 21
 
     @pytest.mark.asyncio
-    async def test_romma_collection_and_persistence(self, test_db, romma_beacon_id):
+    async def test_romma_collection_and_persistence(self, test_db, parameters, romma_beacon_id):
         """Test full observation collection -> persistence -> retrieval flow."""
         from collectors import ROMMaCollector
-        from core.models import Observation, Parameter, Site
+        from core.models import Observation, Site
         from services.storage_service import save_observations
 
         # Setup: Create required database records
@@ -139,11 +133,8 @@ class TestObservationCollectionPipeline:
             altitude=1360,
             romma_beacon_id=romma_beacon_id,
         )
-        param_wind_speed = Parameter(name="wind_speed", unit="km/h")
-        param_wind_dir = Parameter(name="wind_direction", unit="degrees")
-        param_temp = Parameter(name="temperature", unit="C")
 
-        test_db.add_all([site, param_wind_speed, param_wind_dir, param_temp])
+        test_db.add_all([site])
         await test_db.commit()
         await test_db.refresh(site)
 
@@ -182,9 +173,9 @@ class TestFullPipelineIntegration:
 
     @pytest.mark.asyncio
     @pytest.mark.slow
-    async def test_full_forecast_collection_job(self, test_db):
+    async def test_full_forecast_collection_job(self, test_db, parameters):
         """Test the full forecast collection job with all collectors."""
-        from core.models import Model, Parameter, Site
+        from core.models import Model, Site
         from scheduler.jobs import collect_all_forecasts
 
         # Setup: Create required database records
@@ -196,11 +187,8 @@ class TestFullPipelineIntegration:
         )
         model_mp = Model(name="Meteo-Parapente", source="Meteo-Parapente API")
         model_arome = Model(name="AROME", source="Météo-France AROME")
-        param_wind_speed = Parameter(name="wind_speed", unit="km/h")
-        param_wind_dir = Parameter(name="wind_direction", unit="degrees")
-        param_temp = Parameter(name="temperature", unit="C")
 
-        test_db.add_all([site, model_mp, model_arome, param_wind_speed, param_wind_dir, param_temp])
+        test_db.add_all([site, model_mp, model_arome])
         await test_db.commit()
 
         # Run the full collection job
@@ -220,9 +208,9 @@ class TestFullPipelineIntegration:
 
     @pytest.mark.asyncio
     @pytest.mark.slow
-    async def test_full_observation_collection_job(self, test_db):
+    async def test_full_observation_collection_job(self, test_db, parameters):
         """Test the full observation collection job with all collectors."""
-        from core.models import Parameter, Site
+        from core.models import Site
         from scheduler.jobs import collect_all_observations
 
         # Setup: Create required database records with beacon IDs
@@ -234,11 +222,8 @@ class TestFullPipelineIntegration:
             romma_beacon_id=21,
             ffvl_beacon_id=67,
         )
-        param_wind_speed = Parameter(name="wind_speed", unit="km/h")
-        param_wind_dir = Parameter(name="wind_direction", unit="degrees")
-        param_temp = Parameter(name="temperature", unit="C")
 
-        test_db.add_all([site, param_wind_speed, param_wind_dir, param_temp])
+        test_db.add_all([site])
         await test_db.commit()
 
         # Run the full collection job
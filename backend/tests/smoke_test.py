@@ -20,16 +20,28 @@ Features:
     - Validates configuration (beacon IDs, API tokens)
 """
 
+import asyncio
+import io
 import os
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
+from urllib.parse import urlsplit
+
+# Site configurations loaded once per process (smoke tests don't modify sites)
+_site_configs_cache: list[dict[str, Any]] | None = None
 
 
 class TestStatus(Enum):
     """Status of a smoke test."""
 
+    # Not a pytest test class despite the name
+    __test__ = False
+
     PENDING = "pending"
     RUNNING = "running"
     SUCCESS = "success"
@@ -45,13 +57,15 @@ class CollectorTestResult:
     status: TestStatus = TestStatus.PENDING
     records_collected: int = 0
     records_persisted: int = 0
-    steps: list[tuple[bool, str]] = field(default_factory=list)
+    step_success: list[bool] = field(default_factory=list)
+    step_message: list[str] = field(default_factory=list)
     error: str | None = None
     duration_seconds: float = 0.0
 
     def add_step(self, success: bool, message: str) -> None:
         """Add a step result."""
-        self.steps.append((success, message))
+        self.step_success.append(success)
+        self.step_message.append(message)
 
     @property
     def success(self) -> bool:
@@ -63,7 +77,6 @@ class CollectorTestResult:
 class SmokeTestResult:
     """Overall smoke test result."""
 
-    collectors: list[CollectorTestResult] = field(default_factory=list)
     total_forecasts_collected: int = 0
     total_forecasts_persisted: int = 0
     total_observations_collected: int = 0
@@ -71,6 +84,22 @@ class SmokeTestResult:
     start_time: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     end_time: datetime | None = None
     status: str = "pending"
+    _collectors: list[CollectorTestResult] = field(default_factory=list, init=False, repr=False)
+    _success_count: int = field(default=0, init=False, repr=False)
+    _failed_count: int = field(default=0, init=False, repr=False)
+
+    def add_collector(self, collector_result: CollectorTestResult) -> None:
+        """Add a collector result and update the status counters."""
+        self._collectors.append(collector_result)
+        if collector_result.success:
+            self._success_count += 1
+        elif collector_result.status == TestStatus.FAILED:
+            self._failed_count += 1
+
+    @property
+    def collectors(self) -> tuple[CollectorTestResult, ...]:
+        """Collector results in the order they were added."""
+        return tuple(self._collectors)
 
     @property
     def duration_seconds(self) -> float:
@@ -82,25 +111,117 @@ class SmokeTestResult:
     @property
     def success_count(self) -> int:
         """Number of successful collectors."""
-        return sum(1 for c in self.collectors if c.success)
+        return self._success_count
 
     @property
     def failed_count(self) -> int:
         """Number of failed collectors."""
-        return sum(1 for c in self.collectors if c.status == TestStatus.FAILED)
+        return self._failed_count
+
+
+def collector_hosts() -> tuple[str, ...]:
+    """Get the hostnames contacted by the collectors under test.
+
+    Returns:
+        Hostnames taken from each collector's endpoint URL.
+    """
+    from collectors import AROMECollector, FFVLCollector, MeteoParapenteCollector, ROMMaCollector
+
+    urls = (
+        MeteoParapenteCollector.API_ENDPOINT,
+        AROMECollector.API_ENDPOINT,
+        ROMMaCollector.BASE_URL,
+        FFVLCollector.BASE_URL,
+    )
+    return tuple(dict.fromkeys(host for host in (urlsplit(url).hostname for url in urls) if host))
+
+
+async def prewarm_dns(hosts: tuple[str, ...]) -> None:
+    """Resolve collector hostnames concurrently before running the checks.
+
+    Overlaps DNS lookups instead of paying them serially inside each
+    collector's first request. Resolution errors are ignored; the collector
+    checks report connectivity problems themselves.
+
+    Args:
+        hosts: Hostnames to resolve.
+    """
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(
+        *(loop.getaddrinfo(host, 443) for host in hosts),
+        return_exceptions=True,
+    )
+
+
+def summarize_params(data: list[Any], parameter_ids: dict[str, int]) -> str:
+    """Summarize the distinct parameters present in collected records.
+
+    Args:
+        data: Collected ForecastData or ObservationData records.
+        parameter_ids: Collector parameter name to ID mapping
+            (e.g. DEFAULT_PARAMETER_IDS).
+
+    Returns:
+        Comma-separated parameter names, each listed once in ID order.
+        IDs missing from the mapping are skipped.
+    """
+    id_to_name = {param_id: name for name, param_id in parameter_ids.items()}
+    ids = {record.parameter_id for record in data}
+    return ", ".join(id_to_name[i] for i in sorted(ids) if i in id_to_name)
+
+
+async def _persist(
+    result: CollectorTestResult,
+    saver: Callable[[list[Any], str], Awaitable[tuple[int, int]]],
+    data: list[Any],
+    source_name: str,
+    dry_run: bool,
+) -> None:
+    """Persist collected records and record the outcome as a step.
+
+    Args:
+        result: Collector result to update.
+        saver: Storage function (save_forecasts or save_observations).
+        data: Collected records.
+        source_name: Name of the source (for logging).
+        dry_run: If True, don't persist to database.
+    """
+    if dry_run:
+        result.add_step(True, "Skipped persistence (dry run)")
+        return
+
+    _, persisted = await saver(data, source_name)
+    result.records_persisted = persisted
+    result.add_step(True, f"Persisted {persisted} records to database")
+
+
+@contextmanager
+def stopwatch(result: CollectorTestResult) -> Iterator[None]:
+    """Record the wall-clock duration of the wrapped block on a collector result.
+
+    Uses a monotonic clock and always sets ``duration_seconds``, including on
+    early returns.
+
+    Args:
+        result: Collector result to update.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        result.duration_seconds = time.perf_counter() - start
 
 
 async def test_meteo_parapente_collector(
     site_config: dict[str, Any],
+    *,
     dry_run: bool = False,
-    verbose: bool = False,
 ) -> CollectorTestResult:
     """Test Meteo-Parapente forecast collector.
 
     Args:
         site_config: Site configuration with coordinates.
         dry_run: If True, don't persist to database.
-        verbose: If True, log detailed information.
 
     Returns:
         CollectorTestResult with test outcome.
@@ -109,67 +230,60 @@ async def test_meteo_parapente_collector(
     from services.storage_service import save_forecasts
 
     result = CollectorTestResult(collector_name="Meteo-Parapente")
-    start_time = datetime.now(timezone.utc)
 
-    try:
-        result.status = TestStatus.RUNNING
-
-        # Initialize collector
-        collector = MeteoParapenteCollector()
-        result.add_step(True, "Initialized collector")
-
-        # Collect forecasts
-        forecast_run = datetime.now(timezone.utc)
-        data = await collector.collect_forecast(
-            site_id=site_config["site_id"],
-            forecast_run=forecast_run,
-            latitude=site_config["latitude"],
-            longitude=site_config["longitude"],
-        )
-
-        if not data:
-            result.add_step(False, "No forecast data returned")
+    with stopwatch(result):
+        try:
+            result.status = TestStatus.RUNNING
+
+            # Initialize collector
+            collector = MeteoParapenteCollector()
+            result.add_step(True, "Initialized collector")
+
+            # Collect forecasts
+            forecast_run = datetime.now(timezone.utc)
+            data = await collector.collect_forecast(
+                site_id=site_config["site_id"],
+                forecast_run=forecast_run,
+                latitude=site_config["latitude"],
+                longitude=site_config["longitude"],
+            )
+
+            if not data:
+                result.add_step(False, "No forecast data returned")
+                result.status = TestStatus.FAILED
+                result.error = "API returned no data"
+                return result
+
+            result.add_step(True, "Connected to API")
+            result.records_collected = len(data)
+            result.add_step(
+                True,
+                f"Collected {len(data)} forecast records for site \"{site_config['name']}\"",
+            )
+
+            # Persist to database
+            await _persist(result, save_forecasts, data, "Meteo-Parapente", dry_run)
+
+            result.status = TestStatus.SUCCESS
+
+        except Exception as e:
             result.status = TestStatus.FAILED
-            result.error = "API returned no data"
-            return result
-
-        result.add_step(True, "Connected to API")
-        result.records_collected = len(data)
-        result.add_step(
-            True,
-            f"Collected {len(data)} forecast records for site \"{site_config['name']}\"",
-        )
-
-        # Persist to database
-        if not dry_run:
-            _, persisted = await save_forecasts(data, "Meteo-Parapente")
-            result.records_persisted = persisted
-            result.add_step(True, f"Persisted {persisted} records to database")
-        else:
-            result.add_step(True, "Skipped persistence (dry run)")
+            result.error = str(e)
+            result.add_step(False, f"Failed: {e}")
 
-        result.status = TestStatus.SUCCESS
-
-    except Exception as e:
-        result.status = TestStatus.FAILED
-        result.error = str(e)
-        result.add_step(False, f"Failed: {e}")
-
-    result.duration_seconds = (datetime.now(timezone.utc) - start_time).total_seconds()
     return result
 
 
 async def test_arome_collector(
     site_config: dict[str, Any],
+    *,
     dry_run: bool = False,
-    verbose: bool = False,
 ) -> CollectorTestResult:
     """Test AROME forecast collector.
 
     Args:
         site_config: Site configuration with coordinates.
         dry_run: If True, don't persist to database.
-        verbose: If True, log detailed information.
 
     Returns:
         CollectorTestResult with test outcome.
@@ -178,74 +292,67 @@ async def test_arome_collector(
     from services.storage_service import save_forecasts
 
     result = CollectorTestResult(collector_name="AROME")
-    start_time = datetime.now(timezone.utc)
 
-    try:
-        result.status = TestStatus.RUNNING
-
-        # Check API token
-        api_token = os.environ.get("METEOFRANCE_API_TOKEN")
-        if not api_token:
-            result.add_step(False, "METEOFRANCE_API_TOKEN not set")
-            result.status = TestStatus.SKIPPED
-            result.error = "Missing METEOFRANCE_API_TOKEN environment variable"
-            return result
-
-        result.add_step(True, "API token configured")
-
-        # Initialize collector
-        collector = AROMECollector()
-        result.add_step(True, "Initialized collector")
-
-        # Collect forecasts
-        forecast_run = datetime.now(timezone.utc)
-        data = await collector.collect_forecast(
-            site_id=site_config["site_id"],
-            forecast_run=forecast_run,
-            latitude=site_config["latitude"],
-            longitude=site_config["longitude"],
-        )
-
-        if not data:
-            result.add_step(False, "No forecast data returned (API may be rate-limited)")
+    with stopwatch(result):
+        try:
+            result.status = TestStatus.RUNNING
+
+            # Check API token
+            api_token = os.environ.get("METEOFRANCE_API_TOKEN")
+            if not api_token:
+                result.add_step(False, "METEOFRANCE_API_TOKEN not set")
+                result.status = TestStatus.SKIPPED
+                result.error = "Missing METEOFRANCE_API_TOKEN environment variable"
+                return result
+
+            result.add_step(True, "API token configured")
+
+            # Initialize collector
+            collector = AROMECollector()
+            result.add_step(True, "Initialized collector")
+
+            # Collect forecasts
+            forecast_run = datetime.now(timezone.utc)
+            data = await collector.collect_forecast(
+                site_id=site_config["site_id"],
+                forecast_run=forecast_run,
+                latitude=site_config["latitude"],
+                longitude=site_config["longitude"],
+            )
+
+            if not data:
+                result.add_step(False, "No forecast data returned (API may be rate-limited)")
+                result.status = TestStatus.FAILED
+                result.error = "API returned no data"
+                return result
+
+            result.add_step(True, "Downloaded GRIB2 data")
+            result.records_collected = len(data)
+            result.add_step(True, f"Collected {len(data)} forecast records")
+
+            # Persist to database
+            await _persist(result, save_forecasts, data, "AROME", dry_run)
+
+            result.status = TestStatus.SUCCESS
+
+        except Exception as e:
             result.status = TestStatus.FAILED
-            result.error = "API returned no data"
-            return result
-
-        result.add_step(True, "Downloaded GRIB2 data")
-        result.records_collected = len(data)
-        result.add_step(True, f"Collected {len(data)} forecast records")
-
-        # Persist to database
-        if not dry_run:
-            _, persisted = await save_forecasts(data, "AROME")
-            result.records_persisted = persisted
-            result.add_step(True, f"Persisted {persisted} records to database")
-        else:
-            result.add_step(True, "Skipped persistence (dry run)")
-
-        result.status = TestStatus.SUCCESS
+            result.error = str(e)
+            result.add_step(False, f"Failed: {e}")
 
-    except Exception as e:
-        result.status = TestStatus.FAILED
-        result.error = str(e)
-        result.add_step(False, f"Failed: {e}")
-
-    result.duration_seconds = (datetime.now(timezone.utc) - start_time).total_seconds()
     return result
 
 
 async def test_romma_collector(
     site_config: dict[str, Any],
+    *,
     dry_run: bool = False,
-    verbose: bool = False,
 ) -> CollectorTestResult:
     """Test ROMMA observation collector.
 
     Args:
         site_config: Site configuration with beacon IDs.
         dry_run: If True, don't persist to database.
-        verbose: If True, log detailed information.
 
     Returns:
         CollectorTestResult with test outcome.
@@ -254,90 +361,74 @@ async def test_romma_collector(
     from services.storage_service import save_observations
 
     result = CollectorTestResult(collector_name="ROMMA")
-    start_time = datetime.now(timezone.utc)
 
-    try:
-        result.status = TestStatus.RUNNING
-
-        # Check beacon ID configuration
-        beacon_id = site_config.get("romma_beacon_id")
-        backup_beacon_id = site_config.get("romma_beacon_id_backup")
-
-        if not beacon_id and not backup_beacon_id:
-            result.add_step(False, "No ROMMA beacon ID configured for site")
-            result.status = TestStatus.SKIPPED
-            result.error = "No ROMMA beacon ID configured"
-            return result
-
-        target_beacon = beacon_id or backup_beacon_id
-        result.add_step(True, f"Using beacon ID: {target_beacon}")
-
-        # Initialize collector
-        collector = ROMMaCollector(beacon_id=target_beacon)
-        result.add_step(True, "Initialized collector")
-
-        # Collect observations
-        observation_time = datetime.now(timezone.utc)
-        data = await collector.collect_observation(
-            site_id=site_config["site_id"],
-            observation_time=observation_time,
-            beacon_id=target_beacon,
-        )
-
-        if not data:
-            result.add_step(False, "No observation data returned (page may be down)")
-            result.status = TestStatus.FAILED
-            result.error = "Beacon returned no data"
-            return result
-
-        result.add_step(True, "Scraped weather station page")
-        result.records_collected = len(data)
-
-        # List the parameters collected
-        param_names = []
-        for obs in data:
-            if obs.parameter_id == 1:
-                param_names.append("wind_speed")
-            elif obs.parameter_id == 2:
-                param_names.append("wind_direction")
-            elif obs.parameter_id == 3:
-                param_names.append("temperature")
-
-        result.add_step(
-            True,
-            f"Collected {len(data)} observation records ({', '.join(param_names)})",
-        )
-
-        # Persist to database
-        if not dry_run:
-            _, persisted = await save_observations(data, "ROMMA")
-            result.records_persisted = persisted
-            result.add_step(True, f"Persisted {persisted} records to database")
-        else:
-            result.add_step(True, "Skipped persistence (dry run)")
+    with stopwatch(result):
+        try:
+            result.status = TestStatus.RUNNING
 
-        result.status = TestStatus.SUCCESS
+            # Check beacon ID configuration
+            beacon_id = site_config.get("romma_beacon_id")
+            backup_beacon_id = site_config.get("romma_beacon_id_backup")
 
-    except Exception as e:
-        result.status = TestStatus.FAILED
-        result.error = str(e)
-        result.add_step(False, f"Failed: {e}")
+            if not beacon_id and not backup_beacon_id:
+                result.add_step(False, "No ROMMA beacon ID configured for site")
+                result.status = TestStatus.SKIPPED
+                result.error = "No ROMMA beacon ID configured"
+                return result
+
+            target_beacon = beacon_id or backup_beacon_id
+            result.add_step(True, f"Using beacon ID: {target_beacon}")
+
+            # Initialize collector
+            collector = ROMMaCollector(beacon_id=target_beacon)
+            result.add_step(True, "Initialized collector")
+
+            # Collect observations
+            observation_time = datetime.now(timezone.utc)
+            data = await collector.collect_observation(
+                site_id=site_config["site_id"],
+                observation_time=observation_time,
+                beacon_id=target_beacon,
+            )
+
+            if not data:
+                result.add_step(False, "No observation data returned (page may be down)")
+                result.status = TestStatus.FAILED
+                result.error = "Beacon returned no data"
+                return result
+
+            result.add_step(True, "Scraped weather station page")
+            result.records_collected = len(data)
+
+            result.add_step(
+                True,
+                f"Collected {len(data)} observation records "
+                f"({summarize_params(data, collector.DEFAULT_PARAMETER_IDS)})",
+            )
+
+            # Persist to database
+            await _persist(result, save_observations, data, "ROMMA", dry_run)
+
+            result.status = TestStatus.SUCCESS
+
+        except Exception as e:
+            result.status = TestStatus.FAILED
+            result.error = str(e)
+            result.add_step(False, f"Failed: {e}")
 
-    result.duration_seconds = (datetime.now(timezone.utc) - start_time).total_seconds()
     return result
 
 
 async def test_ffvl_collector(
     site_config: dict[str, Any],
+    *,
     dry_run: bool = False,
-    verbose: bool = False,
 ) -> CollectorTestResult:
     """Test FFVL observation collector.
 
     Args:
         site_config: Site configuration with beacon IDs.
         dry_run: If True, don't persist to database.
-        verbose: If True, log detailed information.
 
     Returns:
         CollectorTestResult with test outcome.
@@ -346,91 +437,90 @@ async def test_ffvl_collector(
     from services.storage_service import save_observations
 
     result = CollectorTestResult(collector_name="FFVL")
-    start_time = datetime.now(timezone.utc)
 
-    try:
-        result.status = TestStatus.RUNNING
-
-        # Check beacon ID configuration
-        beacon_id = site_config.get("ffvl_beacon_id")
-        backup_beacon_id = site_config.get("ffvl_beacon_id_backup")
-
-        if not beacon_id and not backup_beacon_id:
-            result.add_step(False, "No FFVL beacon ID configured for site")
-            result.status = TestStatus.SKIPPED
-            result.error = "No FFVL beacon ID configured"
-            return result
-
-        target_beacon = beacon_id or backup_beacon_id
-        result.add_step(True, f"Using beacon ID: {target_beacon}")
-
-        # Initialize collector
-        collector = FFVLCollector(beacon_id=target_beacon)
-        result.add_step(True, "Initialized collector")
-
-        # Collect observations
-        observation_time = datetime.now(timezone.utc)
-        data = await collector.collect_observation(
-            site_id=site_config["site_id"],
-            observation_time=observation_time,
-            beacon_id=target_beacon,
-        )
-
-        if not data:
-            result.add_step(False, "No observation data returned (beacon may be down)")
-            result.status = TestStatus.FAILED
-            result.error = "Beacon returned no data"
-            return result
-
-        result.add_step(True, "Scraped weather station page")
-        result.records_collected = len(data)
-
-        # List the parameters collected
-        param_names = []
-        for obs in data:
-            if obs.parameter_id == 1:
-                param_names.append("wind_speed")
-            elif obs.parameter_id == 2:
-                param_names.append("wind_direction")
-            elif obs.parameter_id == 3:
-                param_names.append("temperature")
-
-        result.add_step(
-            True,
-            f"Collected {len(data)} observation records ({', '.join(param_names)})",
-        )
-
-        # Persist to database
-        if not dry_run:
-            _, persisted = await save_observations(data, "FFVL")
-            result.records_persisted = persisted
-            result.add_step(True, f"Persisted {persisted} records to database")
-        else:
-            result.add_step(True, "Skipped persistence (dry run)")
+    with stopwatch(result):
+        try:
+            result.status = TestStatus.RUNNING
+
+            # Check beacon ID configuration
+            beacon_id = site_config.get("ffvl_beacon_id")
+            backup_beacon_id = site_config.get("ffvl_beacon_id_backup")
+
+            if not beacon_id and not backup_beacon_id:
+                result.add_step(False, "No FFVL beacon ID configured for site")
+                result.status = TestStatus.SKIPPED
+                result.error = "No FFVL beacon ID configured"
+                return result
+
+            target_beacon = beacon_id or backup_beacon_id
+            result.add_step(True, f"Using beacon ID: {target_beacon}")
+
+            # Initialize collector
+            collector = FFVLCollector(beacon_id=target_beacon)
+            result.add_step(True, "Initialized collector")
+
+            # Collect observations
+            observation_time = datetime.now(timezone.utc)
+            data = await collector.collect_observation(
+                site_id=site_config["site_id"],
+                observation_time=observation_time,
+                beacon_id=target_beacon,
+            )
+
+            if not data:
+                result.add_step(False, "No observation data returned (beacon may be down)")
+                result.status = TestStatus.FAILED
+                result.error = "Beacon returned no data"
+                return result
+
+            result.add_step(True, "Scraped weather station page")
+            result.records_collected = len(data)
 
-        result.status = TestStatus.SUCCESS
+            result.add_step(
+                True,
+                f"Collected {len(data)} observation records "
+                f"({summarize_params(data, collector.DEFAULT_PARAMETER_IDS)})",
+            )
 
-    except Exception as e:
-        result.status = TestStatus.FAILED
-        result.error = str(e)
-        result.add_step(False, f"Failed: {e}")
+            # Persist to database
+            await _persist(result, save_observations, data, "FFVL", dry_run)
+
+            result.status = TestStatus.SUCCESS
+
+        except Exception as e:
+            result.status = TestStatus.FAILED
+            result.error = str(e)
+            result.add_step(False, f"Failed: {e}")
 
-    result.duration_seconds = (datetime.now(timezone.utc) - start_time).total_seconds()
     return result
 
 
+def clear_site_config_cache() -> None:
+    """Clear the cached site configurations (e.g. after adding sites)."""
+    global _site_configs_cache
+    _site_configs_cache = None
+
+
 async def get_site_config_for_test(site_name: str | None = None) -> dict[str, Any] | None:
     """Get site configuration for testing.
 
+    Site configurations are fetched from the database on first use and
+    cached for the rest of the process.
+
     Args:
         site_name: Optional site name filter.
 
     Returns:
         Site configuration dict or None if not found.
     """
-    from scheduler.jobs import get_site_configs_async
+    global _site_configs_cache
+
+    if _site_configs_cache is None:
+        from scheduler.jobs import get_site_configs_async
+
+        _site_configs_cache = await get_site_configs_async()
 
-    sites = await get_site_configs_async()
+    sites = _site_configs_cache
 
     if not sites:
         return None
@@ -472,6 +562,8 @@ async def run_smoke_test(
         result.end_time = datetime.now(timezone.utc)
         return result
 
+    await prewarm_dns(collector_hosts())
+
     # Test collectors
     collectors_to_test = [
         ("Meteo-Parapente", test_meteo_parapente_collector, True),
@@ -481,12 +573,8 @@ async def run_smoke_test(
     ]
 
     for name, test_func, is_forecast in collectors_to_test:
-        collector_result = await test_func(
-            site_config=site_config,
-            dry_run=dry_run,
-            verbose=verbose,
-        )
-        result.collectors.append(collector_result)
+        collector_result = await test_func(site_config, dry_run=dry_run)
+        result.add_collector(collector_result)
 
         # Update totals
         if is_forecast:
@@ -524,41 +612,41 @@ def format_smoke_test_output(
     Returns:
         Formatted string output.
     """
-    lines = []
-    lines.append("")
-    lines.append("=== Smoke Test: Data Collection Pipeline ===")
-    lines.append(f"Site: {site_name}")
-    lines.append("")
+    buf = io.StringIO()
+    w = buf.write
+    total = len(result.collectors)
+
+    w("\n=== Smoke Test: Data Collection Pipeline ===\n")
+    w(f"Site: {site_name}\n\n")
 
     for i, collector in enumerate(result.collectors, 1):
-        lines.append(f"[{i}/{len(result.collectors)}] Testing {collector.collector_name} collector...")
+        w(f"[{i}/{total}] Testing {collector.collector_name} collector...\n")
 
-        for success, message in collector.steps:
+        for success, message in zip(collector.step_success, collector.step_message):
             icon = "+" if success else "x"
-            lines.append(f"  {icon} {message}")
+            w(f"  {icon} {message}\n")
 
         if collector.status == TestStatus.SKIPPED:
-            lines.append(f"  - SKIPPED: {collector.error}")
+            w(f"  - SKIPPED: {collector.error}\n")
 
-        lines.append("")
+        w("\n")
 
     # Summary
-    lines.append("=== Summary ===")
-    lines.append(
+    w("=== Summary ===\n")
+    w(
         f"Forecasts: {result.total_forecasts_collected} collected, "
-        f"{result.total_forecasts_persisted} persisted"
+        f"{result.total_forecasts_persisted} persisted\n"
     )
-    lines.append(
+    w(
         f"Observations: {result.total_observations_collected} collected, "
-        f"{result.total_observations_persisted} persisted"
+        f"{result.total_observations_persisted} persisted\n"
     )
 
     status_msg = result.status.upper()
     if result.failed_count > 0:
         status_msg += f" ({result.failed_count} collector(s) failed)"
 
-    lines.append(f"Status: {status_msg}")
-    lines.append(f"Duration: {result.duration_seconds:.2f}s")
-    lines.append("")
+    w(f"Status: {status_msg}\n")
+    w(f"Duration: {result.duration_seconds:.2f}s\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
@@ -9,20 +9,84 @@ Tests verify:
 - Stats and data preview endpoints
 """
 
-import base64
-import os
+import asyncio
+import time
 from unittest.mock import AsyncMock, patch
 
 import pytest
-from httpx import AsyncClient
-
-from scheduler.scheduler import get_scheduler, reset_scheduler
-
-
-def get_auth_header(username: str = "admin", password: str = "changeme") -> dict:
-    """Create Basic Auth header."""
-    credentials = base64.b64encode(f"{username}:{password}".encode()).decode()
-    return {"Authorization": f"Basic {credentials}"}
+from httpx import AsyncClient, BasicAuth
+
+from scheduler.scheduler import reset_scheduler
+
+# Basic Auth credentials; httpx encodes each Authorization header once
+_ADMIN_AUTH = BasicAuth("admin", "changeme")
+_BAD_USER_AUTH = BasicAuth("wrong", "changeme")
+_BAD_PASSWORD_AUTH = BasicAuth("admin", "wrong")
+_BAD_AUTH = BasicAuth("wrong", "wrong")
+
+
+async def _collect_nothing(*args, **kwargs) -> list:
+    """Stand-in collection job that returns no results."""
+    return []
+
+
+# Canned service results returned by patched admin route dependencies
+_MOCK_EXECUTION_HISTORY = [
+    {
+        "start_time": "2026-01-17T10:00:00Z",
+        "end_time": "2026-01-17T10:01:00Z",
+        "duration_seconds": 60.0,
+        "status": "success",
+        "records_collected": 100,
+        "records_persisted": 95,
+        "errors": None,
+    }
+]
+
+_MOCK_COLLECTION_RESULT = {
+    "status": "success",
+    "records_collected": 100,
+    "records_persisted": 95,
+    "duration_seconds": 30.5,
+    "errors": None,
+}
+
+_MOCK_STATS = {
+    "total_forecasts": 1234,
+    "total_observations": 567,
+    "total_deviations": 890,
+    "total_pairs": 123,
+    "total_sites": 1,
+}
+
+_MOCK_PREVIEW = {
+    "forecasts": {
+        "AROME": [
+            {
+                "id": 1,
+                "site": "Passy",
+                "parameter": "Wind Speed",
+                "valid_time": "2026-01-17T12:00:00Z",
+                "value": 15.5,
+                "created_at": "2026-01-17T10:00:00Z",
+            }
+        ],
+        "Meteo-Parapente": [],
+    },
+    "observations": {
+        "ROMMA": [
+            {
+                "id": 1,
+                "site": "Passy",
+                "parameter": "Wind Speed",
+                "observation_time": "2026-01-17T12:00:00Z",
+                "value": 12.3,
+                "created_at": "2026-01-17T12:05:00Z",
+            }
+        ],
+        "FFVL": [],
+    },
+}
 
 
 class TestBasicAuthMiddleware:
@@ -31,37 +95,41 @@ class TestBasicAuthMiddleware:
     @pytest.fixture(autouse=True)
     def clear_rate_limit_state(self):
         """Clear rate limit state before each test."""
-        from api.dependencies.auth import _failed_attempts
-        _failed_attempts.clear()
+        from api.dependencies.auth import _buckets
+        _buckets.clear()
         yield
-        _failed_attempts.clear()
+        _buckets.clear()
 
     @pytest.mark.asyncio
-    async def test_reject_missing_credentials(self, test_client: AsyncClient):
-        """Test that missing credentials returns 401."""
-        response = await test_client.get("/api/admin/scheduler/status")
+    @pytest.mark.parametrize(
+        "auth",
+        [
+            None,
+            _BAD_USER_AUTH,
+            _BAD_PASSWORD_AUTH,
+        ],
+        ids=["missing_credentials", "invalid_username", "invalid_password"],
+    )
+    async def test_reject_bad_credentials(self, test_client: AsyncClient, auth: BasicAuth | None):
+        """Test that missing or invalid credentials return 401."""
+        response = await test_client.get("/api/admin/scheduler/status", auth=auth)
 
         assert response.status_code == 401
         assert response.headers.get("WWW-Authenticate") == "Basic"
 
     @pytest.mark.asyncio
-    async def test_reject_invalid_username(self, test_client: AsyncClient):
-        """Test that invalid username returns 401."""
-        response = await test_client.get(
-            "/api/admin/scheduler/status",
-            headers=get_auth_header(username="wrong", password="changeme"),
-        )
-
-        assert response.status_code == 401
-
-    @pytest.mark.asyncio
-    async def test_reject_invalid_password(self, test_client: AsyncClient):
-        """Test that invalid password returns 401."""
-        response = await test_client.get(
+    @pytest.mark.parametrize(
+        "path",
+        [
             "/api/admin/scheduler/status",
-            headers=get_auth_header(username="admin", password="wrong"),
-        )
-
+            "/api/admin/scheduler/jobs",
+            "/api/admin/stats",
+            "/api/admin/data-preview",
+        ],
+    )
+    async def test_endpoint_requires_auth(self, test_client: AsyncClient, path: str):
+        """Test that admin endpoints reject unauthenticated requests."""
+        response = await test_client.get(path)
         assert response.status_code == 401
 
     @pytest.mark.asyncio
@@ -69,53 +137,101 @@ class TestBasicAuthMiddleware:
         """Test that valid credentials are accepted."""
         response = await test_client.get(
             "/api/admin/scheduler/status",
-            headers=get_auth_header(),
+            auth=_ADMIN_AUTH,
         )
 
         assert response.status_code == 200
 
     @pytest.mark.asyncio
-    async def test_credentials_from_environment(self, test_client: AsyncClient):
-        """Test that credentials are read from environment variables."""
-        with patch.dict(os.environ, {"ADMIN_USERNAME": "testuser", "ADMIN_PASSWORD": "testpass"}):
-            # Clear the cached credentials by importing fresh
+    async def test_credentials_from_settings(
+        self, test_client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that credentials are read from application settings."""
+        from api.dependencies import auth
+        from core.config import Settings
+
+        monkeypatch.setattr(
+            auth,
+            "get_settings",
+            lambda: Settings(admin_username="testuser", admin_password="testpass"),
+        )
 
-            # Test with old credentials (should fail)
-            response = await test_client.get(
-                "/api/admin/scheduler/status",
-                headers=get_auth_header(username="admin", password="changeme"),
-            )
-            # Note: This may or may not fail depending on caching - the key point
-            # is that the env vars are being read
+        # Default credentials no longer work
+        response = await test_client.get(
+            "/api/admin/scheduler/jobs",
+            auth=_ADMIN_AUTH,
+        )
+        assert response.status_code == 401
 
-            # Test with new credentials (should work)
-            response = await test_client.get(
-                "/api/admin/scheduler/status",
-                headers=get_auth_header(username="testuser", password="testpass"),
-            )
-            assert response.status_code == 200
+        # Configured credentials are accepted
+        response = await test_client.get(
+            "/api/admin/scheduler/jobs",
+            auth=BasicAuth("testuser", "testpass"),
+        )
+        assert response.status_code == 200
 
     @pytest.mark.asyncio
     async def test_rate_limit_after_failed_attempts(self, test_client: AsyncClient):
         """Test that rate limiting kicks in after multiple failed attempts."""
         from api.dependencies.auth import _ADMIN_RATE_LIMIT
 
-        # Make several failed attempts
-        for _ in range(_ADMIN_RATE_LIMIT):
-            response = await test_client.get(
-                "/api/admin/scheduler/status",
-                headers=get_auth_header(username="wrong", password="wrong"),
+        # Make several concurrent failed attempts. verify_admin runs in FastAPI's
+        # threadpool, so these hit the bucket from worker threads; the bucket
+        # lock makes each attempt consume exactly one token.
+        responses = await asyncio.gather(
+            *(
+                test_client.get(
+                    "/api/admin/scheduler/status",
+                    auth=_BAD_AUTH,
+                )
+                for _ in range(_ADMIN_RATE_LIMIT)
             )
-            assert response.status_code == 401
+        )
+        assert all(r.status_code == 401 for r in responses)
 
         # Next attempt should be rate limited
         response = await test_client.get(
             "/api/admin/scheduler/status",
-            headers=get_auth_header(username="wrong", password="wrong"),
+            auth=_BAD_AUTH,
         )
         assert response.status_code == 429
         assert "Retry-After" in response.headers
 
+    def test_concurrent_failed_attempts_are_all_recorded(self):
+        """Test failed attempts recorded from many threads are never lost."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from api.dependencies.auth import (
+            _ADMIN_RATE_LIMIT,
+            _available_tokens,
+            _record_failed_attempt,
+        )
+
+        attempts = 200
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(_record_failed_attempt, ["5.6.7.8"] * attempts))
+
+        tokens = _available_tokens("5.6.7.8", time.monotonic())
+        # Allow for the small refill while the threads run
+        assert tokens == pytest.approx(_ADMIN_RATE_LIMIT - attempts, abs=0.5)
+
+    def test_rate_limit_tokens_refill_over_time(self):
+        """Test that a drained bucket regains tokens as time passes."""
+        from api.dependencies.auth import (
+            _ADMIN_RATE_LIMIT,
+            _ADMIN_RATE_WINDOW,
+            _available_tokens,
+            _buckets,
+        )
+
+        _buckets["1.2.3.4"] = (0.0, 100.0)
+
+        assert _available_tokens("1.2.3.4", 100.0) == 0.0
+        assert _available_tokens("1.2.3.4", 100.0 + _ADMIN_RATE_WINDOW / 2) == pytest.approx(
+            _ADMIN_RATE_LIMIT / 2
+        )
+        assert _available_tokens("1.2.3.4", 100.0 + _ADMIN_RATE_WINDOW * 10) == _ADMIN_RATE_LIMIT
+
 
 class TestSchedulerStatusEndpoint:
     """Tests for GET /api/admin/scheduler/status endpoint."""
@@ -125,7 +241,7 @@ class TestSchedulerStatusEndpoint:
         """Test that endpoint returns scheduler running status."""
         response = await test_client.get(
             "/api/admin/scheduler/status",
-            headers=get_auth_header(),
+            auth=_ADMIN_AUTH,
         )
 
         assert response.status_code == 200
@@ -138,7 +254,7 @@ class TestSchedulerStatusEndpoint:
         """Test that endpoint returns execution history lists."""
         response = await test_client.get(
             "/api/admin/scheduler/status",
-            headers=get_auth_header(),
+            auth=_ADMIN_AUTH,
         )
 
         assert response.status_code == 200
@@ -151,27 +267,14 @@ class TestSchedulerStatusEndpoint:
     @pytest.mark.asyncio
     async def test_execution_record_structure(self, test_client: AsyncClient):
         """Test execution record has expected fields when history exists."""
-        # Mock the execution history to return test data
-        mock_history = [
-            {
-                "start_time": "2026-01-17T10:00:00Z",
-                "end_time": "2026-01-17T10:01:00Z",
-                "duration_seconds": 60.0,
-                "status": "success",
-                "records_collected": 100,
-                "records_persisted": 95,
-                "errors": None,
-            }
-        ]
-
         with patch(
             "api.routes.admin.get_execution_history_async",
             new_callable=AsyncMock,
-            return_value=mock_history,
+            return_value=_MOCK_EXECUTION_HISTORY,
         ):
             response = await test_client.get(
                 "/api/admin/scheduler/status",
-                headers=get_auth_header(),
+                auth=_ADMIN_AUTH,
             )
 
             assert response.status_code == 200
@@ -195,7 +298,7 @@ class TestSchedulerJobsEndpoint:
         """Test that endpoint returns jobs list."""
         response = await test_client.get(
             "/api/admin/scheduler/jobs",
-            headers=get_auth_header(),
+            auth=_ADMIN_AUTH,
         )
 
         assert response.status_code == 200
@@ -209,7 +312,7 @@ class TestSchedulerJobsEndpoint:
         # This test may return empty jobs if scheduler hasn't been started
         response = await test_client.get(
             "/api/admin/scheduler/jobs",
-            headers=get_auth_header(),
+            auth=_ADMIN_AUTH,
         )
 
         assert response.status_code == 200
@@ -237,7 +340,7 @@ class TestSchedulerToggleEndpoint:
         """Test that toggle returns the new running state."""
         response = await test_client.post(
             "/api/admin/scheduler/toggle",
-            headers=get_auth_header(),
+            auth=_ADMIN_AUTH,
         )
 
         assert response.status_code == 200
@@ -247,14 +350,12 @@ class TestSchedulerToggleEndpoint:
         assert isinstance(data["running"], bool)
 
     @pytest.mark.asyncio
-    async def test_toggle_starts_stopped_scheduler(self, test_client: AsyncClient):
-        """Test that toggle starts a stopped scheduler."""
-        scheduler = get_scheduler()
-        assert not scheduler.running
-
+    async def test_toggle_round_trip(self, test_client: AsyncClient):
+        """Test that toggle starts a stopped scheduler, then stops it again."""
+        # reset_scheduler_state guarantees the scheduler starts out stopped
         response = await test_client.post(
             "/api/admin/scheduler/toggle",
-            headers=get_auth_header(),
+            auth=_ADMIN_AUTH,
         )
 
         assert response.status_code == 200
@@ -262,22 +363,9 @@ class TestSchedulerToggleEndpoint:
         assert data["running"] is True
         assert "started" in data["message"].lower()
 
-    @pytest.mark.asyncio
-    async def test_toggle_stops_running_scheduler(self, test_client: AsyncClient):
-        """Test that toggle stops a running scheduler."""
-        # First start the scheduler
-        await test_client.post(
-            "/api/admin/scheduler/toggle",
-            headers=get_auth_header(),
-        )
-
-        scheduler = get_scheduler()
-        assert scheduler.running
-
-        # Now toggle again to stop
         response = await test_client.post(
             "/api/admin/scheduler/toggle",
-            headers=get_auth_header(),
+            auth=_ADMIN_AUTH,
         )
 
         assert response.status_code == 200
@@ -293,14 +381,10 @@ class TestManualCollectionEndpoints:
     async def test_trigger_forecasts_returns_response(self, test_client: AsyncClient):
         """Test that forecast trigger returns collection response."""
         # Mock the collect_all_forecasts function to avoid external API calls
-        with patch(
-            "api.routes.admin.collect_all_forecasts",
-            new_callable=AsyncMock,
-            return_value=[],
-        ):
+        with patch("api.routes.admin.collect_all_forecasts", _collect_nothing):
             response = await test_client.post(
                 "/api/admin/collect/forecasts",
-                headers=get_auth_header(),
+                auth=_ADMIN_AUTH,
             )
 
         assert response.status_code == 200
@@ -313,14 +397,10 @@ class TestManualCollectionEndpoints:
     async def test_trigger_observations_returns_response(self, test_client: AsyncClient):
         """Test that observation trigger returns collection response."""
         # Mock the collect_all_observations function to avoid external API calls
-        with patch(
-            "api.routes.admin.collect_all_observations",
-            new_callable=AsyncMock,
-            return_value=[],
-        ):
+        with patch("api.routes.admin.collect_all_observations", _collect_nothing):
             response = await test_client.post(
                 "/api/admin/collect/observations",
-                headers=get_auth_header(),
+                auth=_ADMIN_AUTH,
             )
 
         assert response.status_code == 200
@@ -332,22 +412,14 @@ class TestManualCollectionEndpoints:
     @pytest.mark.asyncio
     async def test_forecast_collection_returns_persisted_count(self, test_client: AsyncClient):
         """Test that forecast collection returns both collected and persisted counts."""
-        mock_result = {
-            "status": "success",
-            "records_collected": 100,
-            "records_persisted": 95,
-            "duration_seconds": 30.5,
-            "errors": None,
-        }
-
         with patch(
             "api.routes.admin.collect_all_forecasts",
             new_callable=AsyncMock,
-            return_value=mock_result,
+            return_value=_MOCK_COLLECTION_RESULT,
         ):
             response = await test_client.post(
                 "/api/admin/collect/forecasts",
-                headers=get_auth_header(),
+                auth=_ADMIN_AUTH,
             )
 
         assert response.status_code == 200
@@ -362,22 +434,14 @@ class TestStatsEndpoint:
     @pytest.mark.asyncio
     async def test_stats_returns_counts(self, test_client: AsyncClient):
         """Test that stats endpoint returns all counts."""
-        mock_stats = {
-            "total_forecasts": 1234,
-            "total_observations": 567,
-            "total_deviations": 890,
-            "total_pairs": 123,
-            "total_sites": 1,
-        }
-
         with patch(
             "api.routes.admin.get_data_stats",
             new_callable=AsyncMock,
-            return_value=mock_stats,
+            return_value=_MOCK_STATS,
         ):
             response = await test_client.get(
                 "/api/admin/stats",
-                headers=get_auth_header(),
+                auth=_ADMIN_AUTH,
             )
 
         assert response.status_code == 200
@@ -388,12 +452,6 @@ class TestStatsEndpoint:
         assert data["totalPairs"] == 123
         assert data["totalSites"] == 1
 
-    @pytest.mark.asyncio
-    async def test_stats_requires_auth(self, test_client: AsyncClient):
-        """Test that stats endpoint requires authentication."""
-        response = await test_client.get("/api/admin/stats")
-        assert response.status_code == 401
-
 
 class TestDataPreviewEndpoint:
     """Tests for GET /api/admin/data-preview endpoint."""
@@ -401,43 +459,14 @@ class TestDataPreviewEndpoint:
     @pytest.mark.asyncio
     async def test_preview_returns_data_structure(self, test_client: AsyncClient):
         """Test that preview endpoint returns expected structure."""
-        mock_preview = {
-            "forecasts": {
-                "AROME": [
-                    {
-                        "id": 1,
-                        "site": "Passy",
-                        "parameter": "Wind Speed",
-                        "valid_time": "2026-01-17T12:00:00Z",
-                        "value": 15.5,
-                        "created_at": "2026-01-17T10:00:00Z",
-                    }
-                ],
-                "Meteo-Parapente": [],
-            },
-            "observations": {
-                "ROMMA": [
-                    {
-                        "id": 1,
-                        "site": "Passy",
-                        "parameter": "Wind Speed",
-                        "observation_time": "2026-01-17T12:00:00Z",
-                        "value": 12.3,
-                        "created_at": "2026-01-17T12:05:00Z",
-                    }
-                ],
-                "FFVL": [],
-            },
-        }
-
         with patch(
             "api.routes.admin.get_recent_data_preview",
             new_callable=AsyncMock,
-            return_value=mock_preview,
+            return_value=_MOCK_PREVIEW,
         ):
             response = await test_client.get(
                 "/api/admin/data-preview",
-                headers=get_auth_header(),
+                auth=_ADMIN_AUTH,
             )
 
         assert response.status_code == 200
@@ -446,9 +475,3 @@ class TestDataPreviewEndpoint:
         assert "observations" in data
         assert "AROME" in data["forecasts"]
         assert "ROMMA" in data["observations"]
-
-    @pytest.mark.asyncio
-    async def test_preview_requires_auth(self, test_client: AsyncClient):
-        """Test that preview endpoint requires authentication."""
-        response = await test_client.get("/api/admin/data-preview")
-        assert response.status_code == 401
@@ -2,12 +2,14 @@
 
 Tests verify:
 - Root endpoint returns healthy status
-- Health endpoint returns healthy status with DB check
+- Health endpoint returns healthy status with DB check matching HealthResponse
 """
 
 import pytest
 from httpx import AsyncClient
 
+from core.schemas import HealthResponse
+
 
 class TestHealthEndpoints:
     """Tests for health check endpoints."""
@@ -23,7 +25,7 @@ class TestHealthEndpoints:
 
     @pytest.mark.asyncio
     async def test_health_endpoint(self, test_client: AsyncClient):
-        """Test health endpoint returns healthy status with DB info."""
+        """Test health endpoint returns healthy status matching HealthResponse."""
         response = await test_client.get("/health")
 
         assert response.status_code == 200
@@ -31,14 +33,6 @@ class TestHealthEndpoints:
         assert data["status"] == "healthy"
         assert "database" in data
 
-    @pytest.mark.asyncio
-    async def test_health_endpoint_response_schema(self, test_client: AsyncClient):
-        """Test health endpoint response matches HealthResponse schema."""
-        from core.schemas import HealthResponse
-
-        response = await test_client.get("/health")
-
-        data = response.json()
         # Should be valid HealthResponse
         health = HealthResponse(**data)
         assert health.status == "healthy"
@@ -17,7 +17,7 @@ class TestModelsEndpoints:
     async def test_get_models_returns_paginated_response(
         self, test_client: AsyncClient
     ):
-        """Test GET /api/models returns correct paginated structure."""
+        """Test GET /api/models returns paginated structure with default meta."""
         response = await test_client.get("/api/models")
 
         assert response.status_code == 200
@@ -31,15 +31,11 @@ class TestModelsEndpoints:
         assert "page" in data["meta"]
         assert "perPage" in data["meta"]
 
-    @pytest.mark.asyncio
-    async def test_get_models_meta_defaults(self, test_client: AsyncClient):
-        """Test GET /api/models meta has correct default values."""
-        response = await test_client.get("/api/models")
-
-        assert response.status_code == 200
-        data = response.json()
+        # Default pagination on an empty database
         assert data["meta"]["page"] == 1
         assert data["meta"]["perPage"] == 100
+        assert data["data"] == []
+        assert data["meta"]["total"] == 0
 
     @pytest.mark.asyncio
     async def test_get_models_pagination_params(self, test_client: AsyncClient):
@@ -59,13 +55,3 @@ class TestModelsEndpoints:
         assert response.status_code == 404
         data = response.json()
         assert "detail" in data
-
-    @pytest.mark.asyncio
-    async def test_get_models_empty_database(self, test_client: AsyncClient):
-        """Test GET /api/models returns empty list when no models exist."""
-        response = await test_client.get("/api/models")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["data"] == []
-        assert data["meta"]["total"] == 0
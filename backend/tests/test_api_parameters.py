@@ -17,7 +17,7 @@ class TestParametersEndpoints:
     async def test_get_parameters_returns_paginated_response(
         self, test_client: AsyncClient
     ):
-        """Test GET /api/parameters returns correct paginated structure."""
+        """Test GET /api/parameters returns paginated structure with default meta."""
         response = await test_client.get("/api/parameters")
 
         assert response.status_code == 200
@@ -31,15 +31,11 @@ class TestParametersEndpoints:
         assert "page" in data["meta"]
         assert "perPage" in data["meta"]
 
-    @pytest.mark.asyncio
-    async def test_get_parameters_meta_defaults(self, test_client: AsyncClient):
-        """Test GET /api/parameters meta has correct default values."""
-        response = await test_client.get("/api/parameters")
-
-        assert response.status_code == 200
-        data = response.json()
+        # Default pagination on an empty database
         assert data["meta"]["page"] == 1
         assert data["meta"]["perPage"] == 100
+        assert data["data"] == []
+        assert data["meta"]["total"] == 0
 
     @pytest.mark.asyncio
     async def test_get_parameters_pagination_params(self, test_client: AsyncClient):
@@ -59,13 +55,3 @@ class TestParametersEndpoints:
         assert response.status_code == 404
         data = response.json()
         assert "detail" in data
-
-    @pytest.mark.asyncio
-    async def test_get_parameters_empty_database(self, test_client: AsyncClient):
-        """Test GET /api/parameters returns empty list when no params exist."""
-        response = await test_client.get("/api/parameters")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["data"] == []
-        assert data["meta"]["total"] == 0
@@ -17,7 +17,7 @@ class TestSitesEndpoints:
 
     @pytest.mark.asyncio
     async def test_get_sites_returns_paginated_response(self, test_client: AsyncClient):
-        """Test GET /api/sites returns correct paginated structure."""
+        """Test GET /api/sites returns paginated structure with default meta."""
         response = await test_client.get("/api/sites")
 
         assert response.status_code == 200
@@ -31,15 +31,11 @@ class TestSitesEndpoints:
         assert "page" in data["meta"]
         assert "perPage" in data["meta"]
 
-    @pytest.mark.asyncio
-    async def test_get_sites_meta_defaults(self, test_client: AsyncClient):
-        """Test GET /api/sites meta has correct default values."""
-        response = await test_client.get("/api/sites")
-
-        assert response.status_code == 200
-        data = response.json()
+        # Default pagination on an empty database
         assert data["meta"]["page"] == 1
         assert data["meta"]["perPage"] == 100
+        assert data["data"] == []
+        assert data["meta"]["total"] == 0
 
     @pytest.mark.asyncio
     async def test_get_sites_pagination_params(self, test_client: AsyncClient):
@@ -69,13 +65,3 @@ class TestSitesEndpoints:
         assert response.status_code == 404
         data = response.json()
         assert "detail" in data
-
-    @pytest.mark.asyncio
-    async def test_get_sites_empty_database(self, test_client: AsyncClient):
-        """Test GET /api/sites returns empty list when no sites exist."""
-        response = await test_client.get("/api/sites")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["data"] == []
-        assert data["meta"]["total"] == 0
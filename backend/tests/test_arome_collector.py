@@ -48,7 +48,11 @@ def forecast_run():
     return datetime(2026, 1, 12, 6, 0, tzinfo=timezone.utc)
 
 
-@pytest.fixture
+# Dataset fixtures are module-scoped: the collector only reads and interpolates
+# them, so tests must not modify them in place.
+
+
+@pytest.fixture(scope="module")
 def mock_xarray_dataset():
     """Create mock xarray dataset simulating GRIB2 data.
 
@@ -75,11 +79,11 @@ def mock_xarray_dataset():
 
     # Create deterministic wind data for predictable tests
     # u10: 5 m/s, v10: 5 m/s → speed = 7.07 m/s = 25.5 km/h
-    u_data = np.full((len(times), len(lats), len(lons)), 5.0)
-    v_data = np.full((len(times), len(lats), len(lons)), 5.0)
+    u_data = np.full((len(times), len(lats), len(lons)), 5.0, dtype=np.float32)
+    v_data = np.full((len(times), len(lats), len(lons)), 5.0, dtype=np.float32)
 
     # Temperature in Kelvin (273.15 = 0°C, so 283.15 = 10°C)
-    t_data = np.full((len(times), len(lats), len(lons)), 283.15)
+    t_data = np.full((len(times), len(lats), len(lons)), 283.15, dtype=np.float32)
 
     ds = xr.Dataset(
         {
@@ -96,7 +100,7 @@ def mock_xarray_dataset():
     return ds
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_xarray_dataset_with_variation():
     """Create mock dataset with varying values for interpolation tests."""
     lats = np.array([45.5, 46.0, 46.5])
@@ -107,9 +111,9 @@ def mock_xarray_dataset_with_variation():
 
     # Create gradient data to test interpolation
     # u varies from 0 to 10 m/s across longitude
-    u_data = np.array([[[0.0, 5.0, 10.0]] * 3])
-    v_data = np.array([[[5.0, 5.0, 5.0]] * 3])
-    t_data = np.array([[[280.0, 283.0, 286.0]] * 3])  # 7°C, 10°C, 13°C
+    u_data = np.array([[[0.0, 5.0, 10.0]] * 3], dtype=np.float32)
+    v_data = np.array([[[5.0, 5.0, 5.0]] * 3], dtype=np.float32)
+    t_data = np.array([[[280.0, 283.0, 286.0]] * 3], dtype=np.float32)  # 7°C, 10°C, 13°C
 
     ds = xr.Dataset(
         {
@@ -126,7 +130,7 @@ def mock_xarray_dataset_with_variation():
     return ds
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_xarray_dataset_missing_wind():
     """Create mock dataset with missing wind components."""
     lats = np.array([45.5, 46.0])
@@ -134,7 +138,7 @@ def mock_xarray_dataset_missing_wind():
     times = np.array([np.datetime64("2026-01-12T06:00:00")])
 
     # Only temperature, no wind data
-    t_data = np.full((1, 2, 2), 283.15)
+    t_data = np.full((1, 2, 2), 283.15, dtype=np.float32)
 
     ds = xr.Dataset(
         {
@@ -149,15 +153,15 @@ def mock_xarray_dataset_missing_wind():
     return ds
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_xarray_dataset_missing_temperature():
     """Create mock dataset with missing temperature."""
     lats = np.array([45.5, 46.0])
     lons = np.array([6.0, 6.5])
     times = np.array([np.datetime64("2026-01-12T06:00:00")])
 
-    u_data = np.full((1, 2, 2), 5.0)
-    v_data = np.full((1, 2, 2), 5.0)
+    u_data = np.full((1, 2, 2), 5.0, dtype=np.float32)
+    v_data = np.full((1, 2, 2), 5.0, dtype=np.float32)
 
     ds = xr.Dataset(
         {
@@ -230,57 +234,34 @@ class TestAROMECollectorStructure:
 class TestWindCalculations:
     """Test wind speed and direction calculations from U/V components."""
 
-    def test_calculate_wind_speed_basic(self, collector):
-        """Test basic wind speed calculation."""
-        # u=3, v=4 → speed = sqrt(9+16) = 5 m/s = 18 km/h
-        speed = collector._calculate_wind_speed(3.0, 4.0)
-        assert speed == Decimal("18.0")
-
-    def test_calculate_wind_speed_zero(self, collector):
-        """Test wind speed calculation with zero wind."""
-        speed = collector._calculate_wind_speed(0.0, 0.0)
-        assert speed == Decimal("0.0")
-
-    def test_calculate_wind_speed_negative_components(self, collector):
-        """Test wind speed with negative U/V components."""
-        # u=-3, v=-4 → speed = sqrt(9+16) = 5 m/s = 18 km/h
-        speed = collector._calculate_wind_speed(-3.0, -4.0)
-        assert speed == Decimal("18.0")
-
-    def test_calculate_wind_speed_conversion_factor(self, collector):
-        """Test m/s to km/h conversion (factor 3.6)."""
-        # 10 m/s = 36 km/h
-        speed = collector._calculate_wind_speed(10.0, 0.0)
-        assert speed == Decimal("36.0")
-
-    def test_calculate_wind_direction_north(self, collector):
-        """Test wind from North (v negative, u zero)."""
-        # Wind coming FROM north: v=-5 (toward south), u=0
-        direction = collector._calculate_wind_direction(0.0, -5.0)
-        assert direction == Decimal("0") or direction == Decimal("360")
-
-    def test_calculate_wind_direction_south(self, collector):
-        """Test wind from South."""
-        # Wind coming FROM south: v=5 (toward north), u=0
-        direction = collector._calculate_wind_direction(0.0, 5.0)
-        assert direction == Decimal("180")
-
-    def test_calculate_wind_direction_east(self, collector):
-        """Test wind from East."""
-        # Wind coming FROM east: u=-5 (toward west), v=0
-        direction = collector._calculate_wind_direction(-5.0, 0.0)
-        assert direction == Decimal("90")
-
-    def test_calculate_wind_direction_west(self, collector):
-        """Test wind from West."""
-        # Wind coming FROM west: u=5 (toward east), v=0
-        direction = collector._calculate_wind_direction(5.0, 0.0)
-        assert direction == Decimal("270")
-
-    def test_calculate_wind_direction_zero_wind(self, collector):
-        """Test wind direction with zero wind."""
-        direction = collector._calculate_wind_direction(0.0, 0.0)
-        assert direction == Decimal("0")
+    @pytest.mark.parametrize(
+        "u, v, expected",
+        [
+            (3.0, 4.0, Decimal("18.0")),  # sqrt(9+16) = 5 m/s = 18 km/h
+            (0.0, 0.0, Decimal("0.0")),
+            (-3.0, -4.0, Decimal("18.0")),  # negative components, same magnitude
+            (10.0, 0.0, Decimal("36.0")),  # m/s to km/h factor 3.6
+        ],
+        ids=["basic", "zero", "negative_components", "conversion_factor"],
+    )
+    def test_calculate_wind_speed(self, collector, u, v, expected):
+        """Test wind speed calculation from U/V components in km/h."""
+        assert collector._calculate_wind_speed(u, v) == expected
+
+    @pytest.mark.parametrize(
+        "u, v, expected",
+        [
+            (0.0, -5.0, {Decimal("0"), Decimal("360")}),  # from North, blowing south
+            (0.0, 5.0, {Decimal("180")}),  # from South, blowing north
+            (-5.0, 0.0, {Decimal("90")}),  # from East, blowing west
+            (5.0, 0.0, {Decimal("270")}),  # from West, blowing east
+            (0.0, 0.0, {Decimal("0")}),  # zero wind
+        ],
+        ids=["north", "south", "east", "west", "zero_wind"],
+    )
+    def test_calculate_wind_direction(self, collector, u, v, expected):
+        """Test meteorological wind direction (where wind comes FROM)."""
+        assert collector._calculate_wind_direction(u, v) in expected
 
     def test_calculate_wind_direction_always_positive(self, collector):
         """Test that wind direction is always in 0-360 range."""
@@ -366,6 +347,14 @@ class TestDataValidation:
         assert collector._is_valid_value("temperature", Decimal("-60.0")) is False
         assert collector._is_valid_value("temperature", Decimal("60.0")) is False
 
+    def test_valid_mask_over_array(self, collector):
+        """Test vectorized validation rejects aberrant and missing values."""
+        values = np.array([-60.0, -50.0, 20.0, 50.0, 60.0, np.nan])
+
+        mask = collector._valid_mask("temperature", values)
+
+        assert mask.tolist() == [False, True, True, True, False, False]
+
 
 # =============================================================================
 # Coordinate Interpolation Tests
@@ -405,6 +394,23 @@ class TestCoordinateInterpolation:
         u_value = float(result["u10"].values.flatten()[0])
         assert 0.0 < u_value < 5.0
 
+    def test_interpolate_descending_latitudes(self, collector):
+        """Test interpolation on grids stored from north to south."""
+        t_data = np.array([[[290.0, 290.0], [280.0, 280.0]]], dtype=np.float32)
+        ds = xr.Dataset(
+            {"t2m": (["valid_time", "latitude", "longitude"], t_data)},
+            coords={
+                "valid_time": [np.datetime64("2026-01-12T06:00:00")],
+                "latitude": [46.0, 45.5],
+                "longitude": [6.0, 6.5],
+            },
+        )
+
+        result = collector._interpolate_to_site(dataset=ds, latitude=45.625, longitude=6.25)
+
+        assert result is not None
+        assert float(result["t2m"].values[0]) == pytest.approx(282.5)
+
     def test_interpolate_outside_grid_returns_none(self, collector, mock_xarray_dataset):
         """Test that interpolation outside grid bounds handles gracefully."""
         # Site far outside grid
@@ -518,6 +524,22 @@ class TestGrib2Parsing:
         assert 6 in horizons
         assert 12 in horizons
 
+    def test_horizons_from_step_axis(self, collector, forecast_run):
+        """Test that timedelta64 steps are used directly as horizons."""
+        steps = np.array([0, 1, 6, 12], dtype="timedelta64[h]").astype("timedelta64[ns]")
+
+        horizons = collector._get_horizons(steps, forecast_run)
+
+        assert horizons.tolist() == [0, 1, 6, 12]
+
+    def test_valid_times_from_step_axis(self, collector, forecast_run):
+        """Test that timedelta64 steps are converted to run + step valid times."""
+        steps = np.array([0, 6], dtype="timedelta64[h]").astype("timedelta64[ns]")
+
+        valid_times = collector._get_valid_times(steps, forecast_run)
+
+        assert valid_times == [forecast_run, forecast_run + timedelta(hours=6)]
+
     @pytest.mark.asyncio
     async def test_parse_grib2_returns_forecast_data_objects(
         self, collector, mock_xarray_dataset, forecast_run
@@ -810,6 +832,10 @@ class TestRequestHeaders:
         user_agent = headers.get("User-Agent", headers.get("user-agent", ""))
         assert "MeteoScore" in user_agent or "meteoscore" in user_agent.lower()
 
+    def test_headers_built_once(self, collector):
+        """Test headers are cached on the collector instead of rebuilt per request."""
+        assert collector._get_headers() is collector._get_headers()
+
 
 # =============================================================================
 # Collect Forecast Integration Tests
@@ -910,6 +936,49 @@ class TestCollectForecastIntegration:
                     assert result.model_id == 3
 
 
+class TestCollectForecastBatch:
+    """Tests for collecting several sites from one AROME download."""
+
+    @pytest.mark.asyncio
+    async def test_batch_downloads_once_for_all_sites(
+        self, collector, mock_xarray_dataset, forecast_run
+    ):
+        """Test the GRIB2 package is downloaded once and split per site."""
+        datasets = {"wind": mock_xarray_dataset.copy(), "temp": mock_xarray_dataset.copy()}
+
+        with patch.object(
+            collector, "_download_grib2", new_callable=AsyncMock, return_value=b"grib2"
+        ) as mock_download, patch.object(
+            collector, "_parse_grib2_bytes", return_value=datasets
+        ):
+            results = await collector.collect_forecast_batch(
+                sites={1: (45.9167, 6.7000), 2: (45.8, 6.6)},
+                forecast_run=forecast_run,
+            )
+
+        mock_download.assert_awaited_once()
+        assert set(results) == {1, 2}
+        for site_id, forecasts in results.items():
+            assert len(forecasts) > 0
+            assert all(f.site_id == site_id for f in forecasts)
+
+    @pytest.mark.asyncio
+    async def test_batch_http_error_returns_empty_lists(self, collector, forecast_run):
+        """Test every site maps to an empty list when the download fails."""
+        with patch.object(
+            collector,
+            "_download_grib2",
+            new_callable=AsyncMock,
+            side_effect=HttpClientError("500 Server Error"),
+        ):
+            results = await collector.collect_forecast_batch(
+                sites={1: (45.9167, 6.7000), 2: (45.8, 6.6)},
+                forecast_run=forecast_run,
+            )
+
+        assert results == {1: [], 2: []}
+
+
 # =============================================================================
 # Collect Observation Tests
 # =============================================================================
@@ -1012,6 +1081,18 @@ class TestRateLimitingEnforcement:
         # Allow some tolerance for timing
         assert elapsed >= collector.MIN_REQUEST_INTERVAL * 0.9
 
+    @pytest.mark.asyncio
+    async def test_rate_limit_spaces_concurrent_calls(self, collector):
+        """Test concurrent callers each wait for their own request slot."""
+        import asyncio
+
+        with patch("collectors.arome.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await asyncio.gather(*(collector._enforce_rate_limit() for _ in range(3)))
+
+        waits = sorted(call.args[0] for call in mock_sleep.await_args_list)
+        interval = collector.MIN_REQUEST_INTERVAL
+        assert waits == [pytest.approx(interval, abs=0.1), pytest.approx(2 * interval, abs=0.1)]
+
 
 # =============================================================================
 # Dataset Cleanup Tests
@@ -1080,3 +1161,26 @@ class TestDatasetCleanup:
 
                 # Verify close was called even though dataset was empty
                 mock_ds.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_all_datasets_closed_when_extraction_raises(self, collector, forecast_run):
+        """Test every parsed dataset is closed when extraction fails."""
+        datasets = {"wind": MagicMock(), "temp": MagicMock()}
+
+        with patch.object(
+            collector, "_download_grib2", new_callable=AsyncMock, return_value=b"grib2"
+        ), patch.object(
+            collector, "_parse_grib2_bytes", return_value=datasets
+        ), patch.object(
+            collector, "_parse_grib2_data", side_effect=RuntimeError("boom")
+        ):
+            results = await collector.collect_forecast(
+                site_id=1,
+                forecast_run=forecast_run,
+                latitude=45.9167,
+                longitude=6.7000,
+            )
+
+        assert results == []
+        datasets["wind"].close.assert_called_once()
+        datasets["temp"].close.assert_called_once()
@@ -32,16 +32,13 @@ from core.data_models import ForecastData, ObservationData
 def fresh_scheduler():
     """Provide a fresh scheduler instance for testing."""
     from scheduler.scheduler import reset_scheduler, get_scheduler
-    from scheduler.jobs import _job_executions
 
     # Reset before test
     reset_scheduler()
-    _job_executions.clear()
     scheduler = get_scheduler()
     yield scheduler
     # Reset after test
     reset_scheduler()
-    _job_executions.clear()
 
 
 @pytest.fixture
@@ -308,7 +305,7 @@ class TestForecastCollectionJob:
 
         with patch("scheduler.jobs.AROMECollector") as mock_arome:
             mock_collector = AsyncMock()
-            mock_collector.collect_forecast.return_value = mock_forecast_data[1:]
+            mock_collector.collect_forecast_batch.return_value = {1: mock_forecast_data[1:]}
             mock_arome.return_value = mock_collector
 
             with patch("scheduler.jobs.MeteoParapenteCollector") as mock_mp:
@@ -318,7 +315,7 @@ class TestForecastCollectionJob:
                 with patch("scheduler.jobs.get_site_configs", return_value=mock_site_configs):
                     result = await collect_all_forecasts()
 
-                mock_collector.collect_forecast.assert_called()
+                mock_collector.collect_forecast_batch.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_collect_forecasts_returns_all_data(
@@ -333,7 +330,9 @@ class TestForecastCollectionJob:
 
             with patch("scheduler.jobs.AROMECollector") as mock_arome:
                 mock_arome.return_value = AsyncMock()
-                mock_arome.return_value.collect_forecast.return_value = mock_forecast_data[1:]
+                mock_arome.return_value.collect_forecast_batch.return_value = {
+                    1: mock_forecast_data[1:]
+                }
 
                 with patch("scheduler.jobs.get_site_configs", return_value=mock_site_configs):
                     result = await collect_all_forecasts()
@@ -353,7 +352,7 @@ class TestForecastCollectionJob:
 
             with patch("scheduler.jobs.AROMECollector") as mock_arome:
                 mock_arome.return_value = AsyncMock()
-                mock_arome.return_value.collect_forecast.return_value = []
+                mock_arome.return_value.collect_forecast_batch.return_value = {}
 
                 with patch("scheduler.jobs.get_site_configs", return_value=mock_site_configs):
                     # Should not raise, should return partial results
@@ -375,7 +374,7 @@ class TestForecastCollectionJob:
 
             with patch("scheduler.jobs.AROMECollector") as mock_arome:
                 mock_arome.return_value = AsyncMock()
-                mock_arome.return_value.collect_forecast.return_value = []
+                mock_arome.return_value.collect_forecast_batch.return_value = {}
 
                 with patch("scheduler.jobs.get_site_configs", return_value=mock_site_configs):
                     with caplog.at_level(logging.INFO):
@@ -398,7 +397,7 @@ class TestForecastCollectionJob:
 
             with patch("scheduler.jobs.AROMECollector") as mock_arome:
                 mock_arome.return_value = AsyncMock()
-                mock_arome.return_value.collect_forecast.return_value = []
+                mock_arome.return_value.collect_forecast_batch.return_value = {}
 
                 with patch("scheduler.jobs.get_site_configs", return_value=mock_site_configs):
                     with caplog.at_level(logging.INFO):
@@ -669,7 +668,7 @@ class TestSchedulerErrorHandling:
 
             with patch("scheduler.jobs.AROMECollector") as mock_arome:
                 mock_arome.return_value = AsyncMock()
-                mock_arome.return_value.collect_forecast.return_value = []
+                mock_arome.return_value.collect_forecast_batch.return_value = {}
 
                 with patch("scheduler.jobs.get_site_configs", return_value=mock_site_configs):
                     with caplog.at_level(logging.ERROR):
@@ -720,7 +719,7 @@ class TestManualTrigger:
 
             with patch("scheduler.jobs.AROMECollector") as mock_arome:
                 mock_arome.return_value = AsyncMock()
-                mock_arome.return_value.collect_forecast.return_value = []
+                mock_arome.return_value.collect_forecast_batch.return_value = {}
 
                 with patch("scheduler.jobs.get_site_configs", return_value=mock_site_configs):
                     # Should be callable directly
@@ -766,7 +765,7 @@ class TestJobStateTracking:
 
             with patch("scheduler.jobs.AROMECollector") as mock_arome:
                 mock_arome.return_value = AsyncMock()
-                mock_arome.return_value.collect_forecast.return_value = []
+                mock_arome.return_value.collect_forecast_batch.return_value = {}
 
                 with patch("scheduler.jobs.get_site_configs", return_value=mock_site_configs):
                     await collect_all_forecasts()
@@ -788,7 +787,7 @@ class TestJobStateTracking:
 
             with patch("scheduler.jobs.AROMECollector") as mock_arome:
                 mock_arome.return_value = AsyncMock()
-                mock_arome.return_value.collect_forecast.return_value = []
+                mock_arome.return_value.collect_forecast_batch.return_value = {}
 
                 with patch("scheduler.jobs.get_site_configs", return_value=mock_site_configs):
                     await collect_all_forecasts()
@@ -809,7 +808,7 @@ class TestJobStateTracking:
 
             with patch("scheduler.jobs.AROMECollector") as mock_arome:
                 mock_arome.return_value = AsyncMock()
-                mock_arome.return_value.collect_forecast.return_value = []
+                mock_arome.return_value.collect_forecast_batch.return_value = {}
 
                 with patch("scheduler.jobs.get_site_configs", return_value=mock_site_configs):
                     await collect_all_forecasts()
@@ -96,7 +96,9 @@ class TestCollectAllForecasts:
                         with patch("scheduler.jobs.save_execution_log", new_callable=AsyncMock):
                             # Make collectors return empty data
                             mock_mp.return_value.collect_forecast = AsyncMock(return_value=[])
-                            mock_arome.return_value.collect_forecast = AsyncMock(return_value=[])
+                            mock_arome.return_value.collect_forecast_batch = AsyncMock(
+                                return_value={}
+                            )
 
                             result = await collect_all_forecasts()
 
@@ -142,7 +144,9 @@ class TestCollectAllForecasts:
                     with patch("scheduler.jobs.save_forecasts", new_callable=AsyncMock, return_value=(1, 1)) as mock_save:
                         with patch("scheduler.jobs.save_execution_log", new_callable=AsyncMock):
                             mock_mp.return_value.collect_forecast = AsyncMock(return_value=mock_forecast_data)
-                            mock_arome.return_value.collect_forecast = AsyncMock(return_value=[])
+                            mock_arome.return_value.collect_forecast_batch = AsyncMock(
+                                return_value={}
+                            )
 
                             result = await collect_all_forecasts()
 
@@ -151,6 +155,54 @@ class TestCollectAllForecasts:
         assert result["records_collected"] == 1
         assert result["records_persisted"] == 1
 
+    @pytest.mark.asyncio
+    async def test_collect_forecasts_skips_arome_sites_without_coordinates(self, caplog):
+        """Test that sites with missing coordinates are left out of the AROME batch."""
+        from scheduler.jobs import collect_all_forecasts
+
+        mock_sites = [
+            {
+                "site_id": 1,
+                "name": "Test Site",
+                "latitude": 45.5,
+                "longitude": 6.5,
+                "romma_beacon_id": 21,
+                "romma_beacon_id_backup": None,
+                "ffvl_beacon_id": 67,
+                "ffvl_beacon_id_backup": None,
+            },
+            {
+                "site_id": 2,
+                "name": "Site Without Coordinates",
+                "latitude": None,
+                "longitude": None,
+                "romma_beacon_id": None,
+                "romma_beacon_id_backup": None,
+                "ffvl_beacon_id": None,
+                "ffvl_beacon_id_backup": None,
+            },
+        ]
+
+        with patch(
+            "scheduler.jobs.get_site_configs_async", new_callable=AsyncMock, return_value=mock_sites
+        ):
+            with patch("scheduler.jobs.MeteoParapenteCollector") as mock_mp:
+                with patch("scheduler.jobs.AROMECollector") as mock_arome:
+                    with patch(
+                        "scheduler.jobs.save_forecasts", new_callable=AsyncMock, return_value=(0, 0)
+                    ):
+                        with patch("scheduler.jobs.save_execution_log", new_callable=AsyncMock):
+                            mock_mp.return_value.collect_forecast = AsyncMock(return_value=[])
+                            mock_arome.return_value.collect_forecast_batch = AsyncMock(
+                                return_value={}
+                            )
+
+                            await collect_all_forecasts()
+
+        batch_call = mock_arome.return_value.collect_forecast_batch.call_args
+        assert batch_call.kwargs["sites"] == {1: (45.5, 6.5)}
+        assert "Missing coordinates for site 2. Cannot fetch from AROME API." in caplog.text
+
 
 class TestCollectAllObservations:
     """Tests for collect_all_observations function."""
@@ -312,7 +364,9 @@ class TestExecutionLogging:
                     with patch("scheduler.jobs.save_forecasts", new_callable=AsyncMock, return_value=(0, 0)):
                         with patch("scheduler.jobs.save_execution_log", new_callable=AsyncMock) as mock_log:
                             mock_mp.return_value.collect_forecast = AsyncMock(return_value=[])
-                            mock_arome.return_value.collect_forecast = AsyncMock(return_value=[])
+                            mock_arome.return_value.collect_forecast_batch = AsyncMock(
+                                return_value={}
+                            )
 
                             await collect_all_forecasts()
 
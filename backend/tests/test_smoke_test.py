@@ -0,0 +1,171 @@
+"""Tests for smoke test helpers.
+
+Tests verify:
+- Parameter summaries list each parameter once, in ID order
+- CLI output formatting
+- Site configuration caching
+- Collector hostnames for DNS pre-warming
+"""
+
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from collectors.romma import ROMMaCollector
+from tests.smoke_test import (
+    CollectorTestResult,
+    SmokeTestResult,
+    TestStatus,
+    clear_site_config_cache,
+    collector_hosts,
+    format_smoke_test_output,
+    get_site_config_for_test,
+    summarize_params,
+)
+
+
+class TestSummarizeParams:
+    """Tests for summarize_params."""
+
+    def test_deduplicates_and_orders_by_id(self):
+        """Test that repeated parameters are listed once, ordered by ID."""
+        data = [SimpleNamespace(parameter_id=i) for i in [3, 1, 1, 2, 3, 1]]
+
+        summary = summarize_params(data, ROMMaCollector.DEFAULT_PARAMETER_IDS)
+
+        assert summary == "wind_speed, wind_direction, temperature"
+
+    def test_skips_unknown_ids(self):
+        """Test that IDs missing from the mapping are ignored."""
+        data = [SimpleNamespace(parameter_id=i) for i in [9, 2, 42]]
+
+        summary = summarize_params(data, ROMMaCollector.DEFAULT_PARAMETER_IDS)
+
+        assert summary == "wind_direction"
+
+    def test_empty_data(self):
+        """Test that no records produce an empty summary."""
+        assert summarize_params([], ROMMaCollector.DEFAULT_PARAMETER_IDS) == ""
+
+
+class TestSmokeTestResult:
+    """Tests for SmokeTestResult counters."""
+
+    def test_add_collector_updates_counts(self):
+        """Test that success and failure counts track added collectors."""
+        result = SmokeTestResult()
+        for status in [
+            TestStatus.SUCCESS,
+            TestStatus.FAILED,
+            TestStatus.SKIPPED,
+            TestStatus.SUCCESS,
+        ]:
+            result.add_collector(CollectorTestResult(collector_name="x", status=status))
+
+        assert len(result.collectors) == 4
+        assert result.success_count == 2
+        assert result.failed_count == 1
+
+    def test_collectors_are_read_only(self):
+        """Test that collectors can only be added through add_collector."""
+        result = SmokeTestResult()
+        result.add_collector(CollectorTestResult(collector_name="x", status=TestStatus.FAILED))
+
+        with pytest.raises(AttributeError):
+            result.collectors.append(CollectorTestResult(collector_name="y"))
+        assert len(result.collectors) == 1
+        assert result.failed_count == 1
+
+
+class TestFormatSmokeTestOutput:
+    """Tests for format_smoke_test_output."""
+
+    def test_formats_steps_and_summary(self):
+        """Test that steps, skipped collectors and the summary are rendered."""
+        result = SmokeTestResult(status="partial", total_forecasts_collected=12)
+        result.end_time = result.start_time + timedelta(seconds=1.5)
+
+        ok = CollectorTestResult(collector_name="AROME", status=TestStatus.SUCCESS)
+        ok.add_step(True, "Initialized collector")
+        skipped = CollectorTestResult(
+            collector_name="FFVL", status=TestStatus.SKIPPED, error="No beacon"
+        )
+        skipped.add_step(False, "No FFVL beacon ID configured for site")
+        result.add_collector(ok)
+        result.add_collector(skipped)
+
+        output = format_smoke_test_output(result, "Passy")
+
+        assert output == (
+            "\n=== Smoke Test: Data Collection Pipeline ===\n"
+            "Site: Passy\n\n"
+            "[1/2] Testing AROME collector...\n"
+            "  + Initialized collector\n\n"
+            "[2/2] Testing FFVL collector...\n"
+            "  x No FFVL beacon ID configured for site\n"
+            "  - SKIPPED: No beacon\n\n"
+            "=== Summary ===\n"
+            "Forecasts: 12 collected, 0 persisted\n"
+            "Observations: 0 collected, 0 persisted\n"
+            "Status: PARTIAL\n"
+            "Duration: 1.50s\n"
+        )
+
+
+class TestGetSiteConfigForTest:
+    """Tests for get_site_config_for_test caching."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        """Start and finish each test with an empty site cache."""
+        clear_site_config_cache()
+        yield
+        clear_site_config_cache()
+
+    @pytest.mark.asyncio
+    async def test_sites_loaded_once(self):
+        """Test that repeated lookups reuse the first database fetch."""
+        sites = [{"site_id": 1, "name": "Passy"}, {"site_id": 2, "name": "Annecy"}]
+
+        with patch(
+            "scheduler.jobs.get_site_configs_async",
+            new_callable=AsyncMock,
+            return_value=sites,
+        ) as mock_get:
+            first = await get_site_config_for_test()
+            named = await get_site_config_for_test("annecy")
+            missing = await get_site_config_for_test("Unknown")
+
+        assert first == sites[0]
+        assert named == sites[1]
+        assert missing is None
+        mock_get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_clear_cache_forces_reload(self):
+        """Test that clearing the cache triggers a new fetch."""
+        with patch(
+            "scheduler.jobs.get_site_configs_async",
+            new_callable=AsyncMock,
+            return_value=[{"site_id": 1, "name": "Passy"}],
+        ) as mock_get:
+            await get_site_config_for_test()
+            clear_site_config_cache()
+            await get_site_config_for_test()
+
+        assert mock_get.await_count == 2
+
+
+class TestCollectorHosts:
+    """Tests for collector_hosts."""
+
+    def test_hosts_from_collector_urls(self):
+        """Test that each collector endpoint host is listed once."""
+        assert collector_hosts() == (
+            "data0.meteo-parapente.com",
+            "public-api.meteofrance.fr",
+            "www.romma.fr",
+            "www.balisemeteo.com",
+        )
@@ -146,6 +146,53 @@ class TestSaveForecasts:
         assert forecasts[0].value == Decimal("15.50")  # Original value preserved
 
 
+    @pytest.mark.asyncio
+    async def test_save_forecasts_batches_inserts(self):
+        """Test that forecasts are inserted in multi-row batches, not per row."""
+        from contextlib import asynccontextmanager
+        from unittest.mock import MagicMock
+
+        from services.storage_service import FORECAST_INSERT_BATCH_SIZE, save_forecasts
+
+        now = datetime.now(timezone.utc)
+        count = FORECAST_INSERT_BATCH_SIZE * 2 + 1
+        forecast_data = [
+            ForecastData(
+                site_id=1,
+                model_id=1,
+                parameter_id=1,
+                forecast_run=now,
+                valid_time=now + timedelta(minutes=i),
+                horizon=0,
+                value=Decimal("10.0"),
+            )
+            for i in range(count)
+        ]
+
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[
+            MagicMock(rowcount=FORECAST_INSERT_BATCH_SIZE),
+            MagicMock(rowcount=FORECAST_INSERT_BATCH_SIZE - 5),
+            MagicMock(rowcount=1),
+        ])
+        db.commit = AsyncMock()
+
+        @asynccontextmanager
+        async def session_context():
+            yield db
+
+        with patch(
+            "services.storage_service.get_async_session_factory",
+            return_value=session_context,
+        ):
+            total, inserted = await save_forecasts(forecast_data, "Test")
+
+        assert db.execute.await_count == 3
+        assert total == count
+        assert inserted == count - 5
+        db.commit.assert_awaited_once()
+
+
 class TestSaveObservations:
     """Tests for save_observations function."""
 